@@ -1,23 +1,150 @@
 # schemas/ai_model.py
 
 from __future__ import annotations
-from transformers import pipeline
+
+import os
+import threading
 
 MODEL_NAME = "jinkyeongk/kcELECTRA-toxic-detector"
 
-# 전역 파이프라인 로딩
-try:
-    toxic_clf = pipeline(
-        "text-classification",
-        model=MODEL_NAME,
-        # top_k=1  # 기본값이라 생략 가능
-    )
-    _AI_MODEL_AVAILABLE = True
-except Exception as e:
-    # 모델 로딩 실패 시, 플래그만 False로 두고 나중에 처리
-    toxic_clf = None
-    _AI_MODEL_AVAILABLE = False
-    _AI_MODEL_LOAD_ERROR = str(e)
+# 모델 서버(app/AI/model_server.py) 유닉스 소켓 경로.
+# 설정돼 있으면 워커마다 모델을 올리지 않고 모델 서버에 추론을 맡김.
+MODEL_SERVER_SOCKET = os.environ.get("MODEL_SERVER_SOCKET") or None
+# 모델 서버 호출이 실패했을 때 이 프로세스에서 직접 모델을 올려서 추론할지
+MODEL_SERVER_FALLBACK = os.environ.get("MODEL_SERVER_FALLBACK", "1") != "0"
+# 서버 시작 시 모델을 미리 올릴지 (기본은 첫 추론 때 로딩 → 워커/테스트 기동이 빠름)
+MODEL_PRELOAD = os.environ.get("MODEL_PRELOAD", "0") == "1"
+
+# 전역 파이프라인 (처음 쓸 때 로딩)
+toxic_clf = None
+_AI_MODEL_AVAILABLE = False
+_AI_MODEL_LOAD_ERROR = "model_not_loaded"
+_load_attempted = False
+_load_lock = threading.Lock()
+
+
+def load_model():
+    """파이프라인 로딩 (한 번만 시도). transformers import 도 여기서 함."""
+    global toxic_clf, _AI_MODEL_AVAILABLE, _AI_MODEL_LOAD_ERROR, _load_attempted
+
+    if _load_attempted:
+        return toxic_clf
+
+    with _load_lock:
+        if _load_attempted:
+            return toxic_clf
+        try:
+            from transformers import pipeline
+
+            toxic_clf = pipeline(
+                "text-classification",
+                model=MODEL_NAME,
+                # top_k=1  # 기본값이라 생략 가능
+            )
+            _AI_MODEL_AVAILABLE = True
+            _AI_MODEL_LOAD_ERROR = None
+        except Exception as e:
+            # 모델 로딩 실패 시, 플래그만 False로 두고 나중에 처리
+            toxic_clf = None
+            _AI_MODEL_AVAILABLE = False
+            _AI_MODEL_LOAD_ERROR = str(e)
+        _load_attempted = True
+
+    return toxic_clf
+
+
+def warmup():
+    """서버 시작 시 호출: MODEL_PRELOAD=1 이고 모델 서버를 안 쓰면 첫 요청 전에 미리 로딩"""
+    if MODEL_PRELOAD and MODEL_SERVER_SOCKET is None:
+        load_model()
+
+
+# ---------- 결과 형식 ---------- #
+def _error_result(error, model_unavailable: bool = False) -> dict:
+    return {
+        "success": False,
+        "error": error or "model_not_available",
+        "is_toxic": False,
+        "label": "AI_ERROR",
+        "score": 0.0,
+        # 모델 자체를 쓸 수 없는 경우 (로딩 실패 / 모델 서버 다운). 문장 문제가 아님
+        "model_unavailable": model_unavailable,
+    }
+
+
+def _empty_result() -> dict:
+    return {
+        "success": True,
+        "error": None,
+        "is_toxic": False,
+        "label": "EMPTY",
+        "score": 0.0,
+    }
+
+
+def _make_result(label: str, score: float, threshold: float) -> dict:
+    return {
+        "success": True,
+        "error": None,
+        "is_toxic": (label == "LABEL_1") and (score >= threshold),
+        "label": label,
+        "score": score,
+    }
+
+
+# ---------- 이 프로세스에서 직접 추론 ---------- #
+def check_pairs_local(pairs: list, batch_size: int = 16) -> list[dict]:
+    """
+    (문장, threshold) 목록을 파이프라인 한 번 호출로 검사.
+    모델 서버도 여러 워커의 요청을 모아서 이 함수로 처리함.
+    """
+    clf = load_model()
+
+    # 1) 모델이 아예 로딩되지 않은 경우
+    if not _AI_MODEL_AVAILABLE or clf is None:
+        return [_error_result(_AI_MODEL_LOAD_ERROR, model_unavailable=True) for _ in pairs]
+
+    results: list[dict | None] = [None] * len(pairs)
+
+    # 빈 문장은 모델에 넣지 않음
+    idx_to_run = []
+    for i, (text, _) in enumerate(pairs):
+        if not text or not text.strip():
+            results[i] = _empty_result()
+        else:
+            idx_to_run.append(i)
+
+    if not idx_to_run:
+        return results
+
+    try:
+        # [{'label': 'LABEL_x', 'score': ...}, ...]
+        outputs = clf([pairs[i][0] for i in idx_to_run], batch_size=batch_size)
+        for i, out in zip(idx_to_run, outputs):
+            results[i] = _make_result(out["label"], float(out["score"]), pairs[i][1])
+    except Exception as e:
+        # 추론 중 에러 (메모리 부족, 토치 내부 에러 등)
+        for i in idx_to_run:
+            results[i] = _error_result(str(e))
+
+    return results
+
+
+def _check_pairs(pairs: list) -> list[dict]:
+    """모델 서버가 설정돼 있으면 먼저 시도하고, 실패하면 (허용된 경우) 직접 추론"""
+    if MODEL_SERVER_SOCKET is not None:
+        from . import model_client
+
+        try:
+            return model_client.classify(MODEL_SERVER_SOCKET, pairs)
+        except model_client.ModelServerError as e:
+            if not MODEL_SERVER_FALLBACK:
+                return [
+                    _error_result(f"model_server_error: {e}", model_unavailable=True)
+                    for _ in pairs
+                ]
+
+    return check_pairs_local(pairs)
 
 
 def check_toxic(text: str, threshold: float = 0.5) -> dict:
@@ -31,47 +158,17 @@ def check_toxic(text: str, threshold: float = 0.5) -> dict:
       "label": str,          # 모델이 낸 label (LABEL_0 / LABEL_1 등)
       "score": float         # 해당 label의 score
     }
+    실패 시에는 "model_unavailable": bool 도 들어감 (모델 로딩 실패 / 모델 서버 다운이면 True)
     """
-    # 1) 모델이 아예 로딩되지 않은 경우
-    if not _AI_MODEL_AVAILABLE or toxic_clf is None:
-        return {
-            "success": False,
-            "error": _AI_MODEL_LOAD_ERROR if '_AI_MODEL_LOAD_ERROR' in globals() else "model_not_available",
-            "is_toxic": False,
-            "label": "AI_ERROR",
-            "score": 0.0,
-        }
-
-    if not text or not text.strip():
-        return {
-            "success": True,
-            "error": None,
-            "is_toxic": False,
-            "label": "EMPTY",
-            "score": 0.0,
-        }
-
-    try:
-        result = toxic_clf(text)[0]   # [{'label': 'LABEL_x', 'score': ...}]
-        label = result["label"]
-        score = float(result["score"])
+    return _check_pairs([(text, threshold)])[0]
 
-        is_toxic = (label == "LABEL_1") and (score >= threshold)
 
-        return {
-            "success": True,
-            "error": None,
-            "is_toxic": is_toxic,
-            "label": label,
-            "score": score,
-        }
-
-    except Exception as e:
-        # 추론 중 에러 (메모리 부족, 토치 내부 에러 등)
-        return {
-            "success": False,
-            "error": str(e),
-            "is_toxic": False,
-            "label": "AI_ERROR",
-            "score": 0.0,
-        }
+def check_toxic_batch(texts: list[str], threshold: float = 0.5) -> list[dict]:
+    """
+    여러 문장을 한 번의 파이프라인 호출로 검사 (댓글 검수 워커용).
+    각 원소는 check_toxic 과 같은 형식의 dict.
+    배치 추론이 실패하면 전부 success=False 로 돌려줘서 호출한 쪽이 재시도하게 함.
+    """
+    if not texts:
+        return []
+    return _check_pairs([(text, threshold) for text in texts])
@@ -0,0 +1,111 @@
+# backend/app/AI/model_client.py
+"""
+모델 서버(app/AI/model_server.py) 클라이언트.
+
+프로토콜: 유닉스 소켓 위에 한 줄짜리 JSON 요청/응답
+  요청  {"items": [[문장, threshold], ...]}
+  응답  {"results": [check_toxic 결과 dict, ...]}  또는  {"error": "..."}
+
+스레드마다 연결을 하나씩 재사용함. 서버가 죽어 있으면 연결 시도마다 기다리지 않도록
+실패 후 RETRY_AFTER_SECONDS 동안은 바로 ModelServerError 를 던짐 (호출한 쪽에서 fallback).
+"""
+import json
+import os
+import socket
+import threading
+import time
+
+CONNECT_TIMEOUT = float(os.environ.get("MODEL_SERVER_CONNECT_TIMEOUT", "0.5"))
+REQUEST_TIMEOUT = float(os.environ.get("MODEL_SERVER_TIMEOUT", "10"))
+RETRY_AFTER_SECONDS = 5.0
+MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+
+
+class ModelServerError(Exception):
+    pass
+
+
+_local = threading.local()
+_down_until = 0.0
+_down_lock = threading.Lock()
+
+
+def _connect(path: str) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(REQUEST_TIMEOUT)
+    return sock
+
+
+def _get_conn(path: str):
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != path:
+        _close()
+        sock = _connect(path)
+        _local.conn = (sock, sock.makefile("rb"))
+        _local.path = path
+    return _local.conn
+
+
+def _close():
+    conn = getattr(_local, "conn", None)
+    _local.conn = None
+    if conn is not None:
+        sock, reader = conn
+        try:
+            reader.close()
+            sock.close()
+        except OSError:
+            pass
+
+
+def _mark_down():
+    global _down_until
+    with _down_lock:
+        _down_until = time.monotonic() + RETRY_AFTER_SECONDS
+
+
+def classify(path: str, pairs: list) -> list:
+    """(문장, threshold) 목록을 모델 서버로 보내고 결과 목록을 받음"""
+    if time.monotonic() < _down_until:
+        raise ModelServerError("model_server_unavailable")
+
+    request = json.dumps({"items": [[t, th] for t, th in pairs]}, ensure_ascii=False)
+    data = request.encode("utf-8") + b"\n"
+
+    # 재사용하던 연결이 서버 재시작 등으로 끊겼을 수 있으니 한 번은 새 연결로 재시도
+    for attempt in range(2):
+        try:
+            sock, reader = _get_conn(path)
+            sock.sendall(data)
+            line = reader.readline(MAX_RESPONSE_BYTES)
+            if not line.endswith(b"\n"):
+                raise ConnectionError("connection closed by model server")
+            break
+        except (OSError, ConnectionError) as e:
+            _close()
+            reused = attempt == 0 and not isinstance(e, (socket.timeout, FileNotFoundError, ConnectionRefusedError))
+            if reused:
+                continue
+            _mark_down()
+            raise ModelServerError(str(e) or e.__class__.__name__)
+
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        _close()
+        raise ModelServerError(f"bad response: {e}")
+
+    if "error" in response:
+        raise ModelServerError(response["error"])
+
+    results = response.get("results")
+    if not isinstance(results, list) or len(results) != len(pairs):
+        _close()
+        raise ModelServerError("bad response: result count mismatch")
+    return results
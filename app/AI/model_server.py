@@ -0,0 +1,143 @@
+# backend/app/AI/model_server.py
+"""
+로컬 모델 서버 (여러 uvicorn 워커가 모델 하나를 같이 쓰기 위한 사이드카 프로세스).
+
+워커 N개가 각자 app.AI.ai_model 을 import 하면 kcELECTRA 가중치가 N벌 올라가서
+메모리가 워커 수만큼 늘어남. 이 프로세스가 모델을 한 번만 올리고, 유닉스 소켓으로 들어온
+모든 워커의 요청을 잠깐(BATCH_WINDOW) 모아서 한 번에 추론함.
+
+실행:
+    python -m app.AI.model_server --socket /tmp/calcalorie-model.sock
+워커 쪽:
+    MODEL_SERVER_SOCKET=/tmp/calcalorie-model.sock uvicorn app.main:app --workers 4
+"""
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from . import ai_model
+
+DEFAULT_SOCKET = "/tmp/calcalorie-model.sock"
+MAX_BATCH = 64             # 한 번에 모델에 넣을 최대 문장 수
+BATCH_WINDOW = 0.005       # 첫 요청이 온 뒤 다른 요청을 기다리는 시간(초)
+MAX_LINE_BYTES = 4 * 1024 * 1024
+
+
+class ModelServer:
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.queue: asyncio.Queue = asyncio.Queue()
+        # 추론은 한 스레드에서만 (모델 하나를 동시에 여러 번 돌리지 않음)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model")
+        self.batches = 0
+        self.items = 0
+
+    async def _next_batch(self):
+        first = await self.queue.get()
+        batch = [first]
+        size = len(first[0])
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + BATCH_WINDOW
+        while size < MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            pairs = [pair for items, _ in batch for pair in items]
+            try:
+                results = await loop.run_in_executor(self.executor, ai_model.check_pairs_local, pairs)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.items += len(pairs)
+            offset = 0
+            for items, fut in batch:
+                if not fut.done():
+                    fut.set_result(results[offset:offset + len(items)])
+                offset += len(items)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    items = [(str(text), float(threshold)) for text, threshold in request["items"]]
+                except Exception as e:
+                    response = {"error": f"bad_request: {e}"}
+                else:
+                    fut = loop.create_future()
+                    await self.queue.put((items, fut))
+                    try:
+                        response = {"results": await fut}
+                    except Exception as e:
+                        response = {"error": str(e)}
+
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        # 모델을 먼저 올려두고 소켓을 열어야 첫 요청이 타임아웃 나지 않음
+        await asyncio.get_running_loop().run_in_executor(self.executor, ai_model.load_model)
+        if not ai_model._AI_MODEL_AVAILABLE:
+            print("[model_server] 모델 로딩 실패:", ai_model._AI_MODEL_LOAD_ERROR)
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(self.handle, path=self.socket_path, limit=MAX_LINE_BYTES)
+        os.chmod(self.socket_path, 0o660)
+        print(f"[model_server] listening on {self.socket_path}")
+
+        batcher = asyncio.create_task(self.batcher())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kcELECTRA 혐오 표현 분류 모델 서버")
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get("MODEL_SERVER_SOCKET", DEFAULT_SOCKET),
+        help="유닉스 소켓 경로",
+    )
+    args = parser.parse_args()
+
+    # 이 프로세스는 자기 자신이 모델 서버이므로 직접 추론
+    ai_model.MODEL_SERVER_SOCKET = None
+    try:
+        asyncio.run(ModelServer(args.socket).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,56 @@
 # backend/app/controllers/post_controller.py
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
-from ..db_models import Post, Comment, User
+from ..db_models import Post, Comment
 from ..schemas import post_schema
 from ..AI.ai_model import check_toxic
+from ..core import export, moderation_worker
+from ..core.admission import comment_rate_limiter, moderation_gate, post_rate_limiter, OVERLOAD_RETRY_AFTER
+from ..core.list_cache import list_page_cache
+from ..core.pubsub import post_events
+from ..core.trending import post_trending
+from ..core.user_deletion import remove_uploaded_files
+from ..core.user_cache import user_cache
+
+TRENDING_MAX_LIMIT = 50
+
+
+def _too_many_requests(retry_after: int):
+    return JSONResponse(
+        status_code=429,
+        content={"message": "too_many_requests", "data": None},
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def _visible_comments_filter(viewer_id: Optional[int] = None):
+    """검수 통과한 댓글 + (viewer 본인이 쓴) 검수 대기 댓글"""
+    visible = Comment.moderation_status == moderation_worker.STATUS_VISIBLE
+    if viewer_id is None:
+        return visible
+    return or_(
+        visible,
+        and_(
+            Comment.moderation_status == moderation_worker.STATUS_PENDING,
+            Comment.author_id == viewer_id,
+        ),
+    )
 
 
 # ---------- 목록 ---------- #
 def list_posts_controller(db: Session, cursor: int, limit: int):
+    # 앞쪽 페이지는 인코딩까지 끝난 응답을 캐시에서 바로 돌려줌
+    cacheable = list_page_cache.cacheable(cursor, limit)
+    if cacheable:
+        cached = list_page_cache.get(cursor, limit)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        generation = list_page_cache.generation()
+
     try:
         total = db.query(Post).count()
 
@@ -22,16 +62,20 @@ def list_posts_controller(db: Session, cursor: int, limit: int):
             .all()
         )
 
-        items = []
-        for p in posts:
-            comments_count = (
-                db.query(Comment)
-                .filter(Comment.post_id == p.id)
-                .count()
+        # 댓글 수는 페이지 단위로 한 번에 집계
+        post_ids = [p.id for p in posts]
+        counts = {}
+        if post_ids:
+            counts = dict(
+                db.query(Comment.post_id, func.count(Comment.id))
+                .filter(Comment.post_id.in_(post_ids), _visible_comments_filter())
+                .group_by(Comment.post_id)
+                .all()
             )
-            items.append(post_schema.make_list_item(p, comments_count))
 
-        return JSONResponse(
+        items = [post_schema.make_list_item(p, counts.get(p.id, 0)) for p in posts]
+
+        response = JSONResponse(
             status_code=200,
             content={
                 "message": "list_ok",
@@ -43,6 +87,9 @@ def list_posts_controller(db: Session, cursor: int, limit: int):
                 },
             },
         )
+        if cacheable:
+            list_page_cache.put(cursor, limit, generation, bytes(response.body), post_ids)
+        return response
     except Exception as e:
         import traceback
 
@@ -54,8 +101,78 @@ def list_posts_controller(db: Session, cursor: int, limit: int):
         )
 
 
+# ---------- 인기글 ---------- #
+def trending_posts_controller(db: Session, cursor: int, limit: int):
+    # 음수 cursor 는 리스트 뒤에서부터 잘려서 엉뚱한 글이 나옴
+    if cursor < 0 or not 1 <= limit <= TRENDING_MAX_LIMIT:
+        return JSONResponse(
+            status_code=400,
+            content={"message": "invalid_request", "data": None},
+        )
+
+    try:
+        # 랭킹은 메모리에서 바로 잘라오고, 화면용 데이터만 DB에서 한 번에 조회
+        post_ids = post_trending.top(limit, offset=cursor)
+
+        posts_by_id = {}
+        counts = {}
+        if post_ids:
+            posts_by_id = {
+                p.id: p for p in db.query(Post).filter(Post.id.in_(post_ids)).all()
+            }
+            counts = dict(
+                db.query(Comment.post_id, func.count(Comment.id))
+                .filter(Comment.post_id.in_(post_ids), _visible_comments_filter())
+                .group_by(Comment.post_id)
+                .all()
+            )
+
+        items = [
+            post_schema.make_list_item(posts_by_id[pid], counts.get(pid, 0))
+            for pid in post_ids
+            if pid in posts_by_id  # 다른 워커에서 이미 삭제된 글은 건너뜀
+        ]
+
+        return JSONResponse(
+            status_code=200,
+            content={
+                "message": "trending_ok",
+                "data": {
+                    "cursor": cursor,
+                    "limit": limit,
+                    "posts": [i.dict() for i in items],
+                },
+            },
+        )
+    except Exception as e:
+        import traceback
+
+        print("[trending_posts_controller] ERROR")
+        print(traceback.format_exc())
+        return JSONResponse(
+            status_code=500,
+            content={"message": "internal_server_error", "data": None},
+        )
+
+
+# ---------- 전체 덤프 (NDJSON) ---------- #
+def export_posts_controller(since_id: int, since_comment_id: int = 0):
+    if since_id < 0 or since_comment_id < 0:
+        return JSONResponse(
+            status_code=400,
+            content={"message": "invalid_request", "data": None},
+        )
+
+    return StreamingResponse(
+        # 공개 API 라 검수 통과한 댓글만 (숨김/대기 댓글 포함 전체 덤프는 CLI 로)
+        export.stream_export(since_id, since_comment_id, visible_only=True),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="posts_since_{since_id}.ndjson"'},
+    )
+
+
 # ---------- 상세 ---------- #
-def get_post_detail_controller(db: Session, post_id: int):
+def get_post_detail_controller(db: Session, post_id: int, viewer_id: Optional[int] = None):
     try:
         # 1) 게시글 찾기
         post = db.query(Post).filter(Post.id == post_id).first()
@@ -73,41 +190,25 @@ def get_post_detail_controller(db: Session, post_id: int):
         post.views += 1
         db.commit()
         db.refresh(post)
+        post_trending.record_view(post.id)
 
-        # 4) 댓글 목록 조회
+        # 4) 댓글 목록 조회 (검수 대기 댓글은 작성자 본인에게만 보임)
         comments = (
             db.query(Comment)
-            .filter(Comment.post_id == post.id)
+            .filter(Comment.post_id == post.id, _visible_comments_filter(viewer_id))
             .order_by(Comment.created_at.asc())
             .all()
         )
 
-        # 5) 댓글 스키마로 변환
+        # 5) 댓글 스키마로 변환 (작성자 닉네임은 사용자 캐시에서 한 번에 조회)
+        authors = user_cache.get_many(db, {c.author_id for c in comments})
+
         comments_out = []
         for c in comments:
             try:
-                # author 정보 안전하게 추출
-                author_nickname = "unknown"
-                if hasattr(c, 'author') and c.author:
-                    author_nickname = getattr(c.author, 'nickname', 'unknown')
-                elif hasattr(c, 'author_id') and c.author_id:
-                    # author 관계가 없으면 DB에서 직접 조회
-                    author = db.query(User).filter(User.id == c.author_id).first()
-                    if author:
-                        author_nickname = author.nickname
-
-                # created_at 안전하게 처리
-                created_at_str = ""
-                if hasattr(c, 'created_at') and c.created_at:
-                    created_at_str = c.created_at.strftime("%Y-%m-%d %H:%M:%S")
-
-                comment_out = post_schema.CommentOut(
-                    id=c.id,
-                    author=author_nickname,
-                    content=c.content,
-                    created_at=created_at_str,
-                )
-                comments_out.append(comment_out)
+                author = authors.get(c.author_id)
+                author_nickname = author.nickname if author else "unknown"
+                comments_out.append(post_schema.make_comment_out(c, author_nickname))
             except Exception as comment_error:
                 print(f"[Warning] 댓글 변환 오류 (comment_id={c.id}):", repr(comment_error))
                 # 오류난 댓글은 건너뛰기
@@ -133,7 +234,16 @@ def get_post_detail_controller(db: Session, post_id: int):
 
 # ---------- 글 작성 ---------- #
 # ---------- 글 작성 ---------- #
-def create_post_controller(db: Session, payload: Dict[str, Any]):
+def create_post_controller(
+    db: Session,
+    payload: Dict[str, Any],
+    save_image: Optional[Callable[[], str]] = None,
+):
+    """
+    save_image: 첨부 이미지를 저장하고 URL 을 돌려주는 함수.
+    속도 제한 / 부하 제한 / AI 검사를 모두 통과한 뒤에만 호출해서
+    거절된 요청이 업로드 파일을 남기지 않게 함.
+    """
     try:
         data = post_schema.PostCreate(**payload)
     except Exception:
@@ -142,16 +252,30 @@ def create_post_controller(db: Session, payload: Dict[str, Any]):
             content={"message": "invalid_request", "data": None},
         )
 
+    # 사용자별 작성 속도 제한
+    allowed, retry_after = post_rate_limiter.allow(data.author_id)
+    if not allowed:
+        return _too_many_requests(retry_after)
+
     # 작성자 확인
-    user = db.query(User).filter(User.id == data.author_id).first()
+    user = user_cache.get(db, data.author_id)
     if not user:
         return JSONResponse(
             status_code=404,
             content={"message": "user_not_found", "data": None},
         )
 
-    # AI 비도덕성 검사
-    moderation = check_toxic(f"{data.title}\n{data.body}", threshold=0.7)
+    # AI 비도덕성 검사 (동시 실행 수 제한, 대기열이 꽉 차면 바로 503)
+    with moderation_gate.slot() as admitted:
+        if not admitted:
+            # 서버 사정으로 거절한 것이므로 사용자의 작성 한도는 깎지 않음
+            post_rate_limiter.refund(data.author_id)
+            return JSONResponse(
+                status_code=503,
+                content={"message": "server_busy", "data": None},
+                headers={"Retry-After": str(OVERLOAD_RETRY_AFTER)},
+            )
+        moderation = check_toxic(f"{data.title}\n{data.body}", threshold=0.7)
     if not moderation["success"]:
         return JSONResponse(
             status_code=500,
@@ -172,16 +296,30 @@ def create_post_controller(db: Session, payload: Dict[str, Any]):
             },
         )
 
+    image_url = data.image_url.strip() if data.image_url else None
+    if save_image is not None:
+        image_url = save_image()
+
     # 실제 Post 생성
-    post = Post(
-        title=data.title.strip(),
-        body=data.body.strip(),
-        author_id=data.author_id,
-        image_url=(data.image_url.strip() if data.image_url else None),
-    )
-    db.add(post)
-    db.commit()
-    db.refresh(post)
+    try:
+        post = Post(
+            title=data.title.strip(),
+            body=data.body.strip(),
+            author_id=data.author_id,
+            image_url=image_url,
+        )
+        db.add(post)
+        db.commit()
+        db.refresh(post)
+    except Exception:
+        db.rollback()
+        # 글이 안 만들어졌으면 방금 저장한 파일도 지움
+        if save_image is not None:
+            remove_uploaded_files([image_url])
+        raise
+    post_trending.record_post(post.id, post.created_at)
+    # 모든 목록 페이지의 total 이 바뀜
+    list_page_cache.invalidate_all()
 
     # ✅ 여기 응답 구조가 프론트에서 postId 뽑는 기준
     return JSONResponse(
@@ -208,6 +346,11 @@ def create_comment_controller(db: Session, post_id: int, payload: Dict[str, Any]
             content={"message": "invalid_request", "data": None},
         )
 
+    # 사용자별 작성 속도 제한
+    allowed, retry_after = comment_rate_limiter.allow(data.author_id)
+    if not allowed:
+        return _too_many_requests(retry_after)
+
     post = db.query(Post).filter(Post.id == post_id).first()
     if not post:
         return JSONResponse(
@@ -215,23 +358,35 @@ def create_comment_controller(db: Session, post_id: int, payload: Dict[str, Any]
             content={"message": "post_not_found", "data": None},
         )
 
-    user = db.query(User).filter(User.id == data.author_id).first()
+    user = user_cache.get(db, data.author_id)
     if not user:
         return JSONResponse(
             status_code=404,
             content={"message": "user_not_found", "data": None},
         )
 
-    # 여기서는 댓글에 대한 비도덕성 검사는 생략 (원하면 check_toxic 추가 가능)
+    # 댓글 비도덕성 검사는 요청 경로에서 하지 않고
+    # pending 상태로 저장 + 검수 대기열에 넣어 백그라운드 워커가 처리
     comment = Comment(
         post_id=post.id,
         author_id=user.id,
         content=data.content.strip(),
     )
     db.add(comment)
+    db.flush()  # comment.id 확보
+    moderation_worker.enqueue_comment(db, comment)
     db.commit()
     db.refresh(comment)
 
+    # 실시간 구독 중인 작성자 본인에게만 검수 대기 댓글 알림
+    # (다른 사람에게는 워커가 검수 통과시킬 때 comment_created 로 전달)
+    post_events.publish(
+        post.id,
+        "comment_pending",
+        post_schema.make_comment_out(comment, user.nickname).dict(),
+        only_viewer_id=user.id,
+    )
+
     return JSONResponse(
         status_code=201,
         content={
@@ -239,6 +394,36 @@ def create_comment_controller(db: Session, post_id: int, payload: Dict[str, Any]
             "data": {
                 "id": comment.id,
                 "post_id": post.id,
+                "moderation_status": comment.moderation_status,
             },
         },
-    )
\ No newline at end of file
+    )
+
+
+# ---------- 실시간 이벤트 (SSE) ---------- #
+def post_events_controller(db: Session, post_id: int, viewer_id: Optional[int] = None):
+    post = db.query(Post.id).filter(Post.id == post_id).first()
+    # 스트림이 열려 있는 동안 DB 커넥션을 잡고 있지 않도록 바로 반납
+    db.close()
+    if not post:
+        return JSONResponse(
+            status_code=404,
+            content={"message": "post_not_found", "data": None},
+        )
+
+    sub = post_events.subscribe(post_id, viewer_id)
+    if sub is None:
+        return JSONResponse(
+            status_code=503,
+            content={"message": "too_many_connections", "data": None},
+            headers={"Retry-After": "30"},
+        )
+
+    return StreamingResponse(
+        sub.frames(post_events),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 끄기
+        },
+    )
@@ -6,6 +6,8 @@ from sqlalchemy.orm import Session
 
 from ..db_models import User
 from ..schemas import user_schema
+from ..core import user_deletion
+from ..core.user_cache import user_cache
 from fastapi.encoders import jsonable_encoder
 #from app.core.security import hash_password 
 
@@ -148,6 +150,7 @@ def update_user_controller(db: Session, user_id: int, payload: Dict[str, Any]):
 
     db.commit()
     db.refresh(user)
+    user_cache.invalidate(user_id)
 
     return JSONResponse(
         status_code=200,
@@ -163,7 +166,8 @@ def update_user_controller(db: Session, user_id: int, payload: Dict[str, Any]):
 
 def delete_user_controller(db: Session, user_id: int):
     """
-    회원 탈퇴 컨트롤러 (유저 + cascade 걸린 게시글/댓글 삭제)
+    회원 탈퇴 컨트롤러 (유저 + 게시글/댓글/업로드 이미지 삭제)
+    글/댓글이 많은 회원은 백그라운드 작업으로 넘기고 202 를 돌려줌
     """
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -172,8 +176,14 @@ def delete_user_controller(db: Session, user_id: int):
             content={"message": "user_not_found", "data": None},
         )
 
-    db.delete(user)
-    db.commit()
+    finished = user_deletion.delete_user(db, user)
+    user_cache.invalidate(user_id)
+    if not finished:
+        return JSONResponse(
+            status_code=202,
+            content={"message": "delete_accepted", "data": None},
+        )
+
     return JSONResponse(
         status_code=204,
         content={"message": "delete_success", "data": None},
@@ -188,5 +198,6 @@ def update_password_controller(db: Session, user_id: int, new_password: str):
     user.password = new_password
     db.commit()
     db.refresh(user)
+    user_cache.invalidate(user_id)
 
     return {"message": "password updated"}
\ No newline at end of file
@@ -0,0 +1,153 @@
+# backend/app/core/admission.py
+"""
+쓰기 요청 부하 제어.
+
+1) AdmissionGate: AI 검사(check_toxic) 동시 실행 수 제한 + 크기가 정해진 대기열.
+   대기열까지 꽉 차면 기다리지 않고 바로 거절 → 503 + Retry-After.
+   검사 요청이 무한정 쌓여 스레드풀을 다 잡아먹는 걸 막아서 조회 API 는 계속 응답함.
+2) RateLimiter: 사용자별 토큰 버킷 (글/댓글 작성 폭주 방지) → 429 + Retry-After.
+
+설정값은 환경변수로 바꿀 수 있음.
+"""
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Tuple
+
+MODERATION_CONCURRENCY = int(os.environ.get("MODERATION_CONCURRENCY", "2"))
+MODERATION_QUEUE_SIZE = int(os.environ.get("MODERATION_QUEUE_SIZE", "8"))
+MODERATION_QUEUE_TIMEOUT = float(os.environ.get("MODERATION_QUEUE_TIMEOUT", "5"))
+OVERLOAD_RETRY_AFTER = 2  # 초
+
+# 사용자별 초당 허용량 / 순간 최대 허용량
+POST_RATE_PER_SEC = float(os.environ.get("POST_RATE_PER_SEC", str(1 / 10)))
+POST_BURST = int(os.environ.get("POST_BURST", "3"))
+COMMENT_RATE_PER_SEC = float(os.environ.get("COMMENT_RATE_PER_SEC", str(1 / 2)))
+COMMENT_BURST = int(os.environ.get("COMMENT_BURST", "5"))
+
+
+class AdmissionGate:
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self._active < self.max_concurrent and self._waiting == 0:
+                self._active += 1
+                self.admitted += 1
+                return True
+
+            if self._waiting >= self.max_queue:
+                self.rejected += 1
+                return False
+
+            self._waiting += 1
+            try:
+                deadline = time.monotonic() + self.queue_timeout
+                while self._active >= self.max_concurrent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        return False
+                    self._cond.wait(remaining)
+                self._active += 1
+                self.admitted += 1
+                return True
+            finally:
+                self._waiting -= 1
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self):
+        """with gate.slot() as admitted: ... (admitted 가 False 면 바로 거절 응답)"""
+        admitted = self.try_acquire()
+        try:
+            yield admitted
+        finally:
+            if admitted:
+                self.release()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "active": self._active,
+                "waiting": self._waiting,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+            }
+
+
+class RateLimiter:
+    """키(사용자 id)별 토큰 버킷. 오래 안 쓴 버킷은 LRU 로 정리."""
+
+    def __init__(self, rate_per_sec: float, burst: int, max_keys: int = 100000):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[object, Tuple[float, float]]" = OrderedDict()  # key → (tokens, 마지막 시각)
+        self.limited = 0
+
+    def allow(self, key) -> Tuple[bool, int]:
+        """(허용 여부, 거절이면 몇 초 뒤 다시 시도할지)"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+
+            if tokens >= 1.0:
+                self._buckets[key] = (tokens - 1.0, now)
+                allowed, retry_after = True, 0
+            else:
+                self._buckets[key] = (tokens, now)
+                self.limited += 1
+                allowed = False
+                retry_after = max(1, math.ceil((1.0 - tokens) / self.rate)) if self.rate > 0 else 60
+
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return allowed, retry_after
+
+    def refund(self, key):
+        """allow 로 쓴 토큰 하나를 되돌려줌 (그 뒤 부하 제한으로 거절돼 실제 작업을 안 한 경우)"""
+        with self._lock:
+            entry = self._buckets.get(key)
+            if entry is None:
+                return
+            tokens, last = entry
+            self._buckets[key] = (min(float(self.burst), tokens + 1.0), last)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"tracked": len(self._buckets), "limited": self.limited}
+
+
+# 프로세스 전역 인스턴스
+moderation_gate = AdmissionGate(MODERATION_CONCURRENCY, MODERATION_QUEUE_SIZE, MODERATION_QUEUE_TIMEOUT)
+post_rate_limiter = RateLimiter(POST_RATE_PER_SEC, POST_BURST)
+comment_rate_limiter = RateLimiter(COMMENT_RATE_PER_SEC, COMMENT_BURST)
+
+
+def stats() -> dict:
+    return {
+        "moderation_gate": moderation_gate.stats(),
+        "post_rate_limit": post_rate_limiter.stats(),
+        "comment_rate_limit": comment_rate_limiter.stats(),
+    }
@@ -0,0 +1,237 @@
+# backend/app/core/export.py
+"""
+게시글 + 댓글 전체 덤프 (NDJSON, 한 줄에 게시글 하나).
+
+게시글을 id 순으로 BATCH_SIZE 개씩 끊어 읽고 (id > 마지막 id 조건이라 OFFSET 없이 일정한 속도),
+그 배치의 댓글은 한 번의 쿼리로 가져옴. 배치마다 바로 줄을 내보내서 메모리 사용량이 일정함.
+조회수(views)는 건드리지 않음.
+
+since_id 를 주면 그보다 큰 id 의 게시글만 내보냄 (증분 백업).
+이미 받아간 게시글(id <= since_id)에 새로 달린 댓글은 since_comment_id 보다 큰 것만
+{"type": "comment", "post_id": ...} 줄로 따로 내보냄.
+마지막 줄 {"type": "end", "last_id": ..., "last_comment_id": ...} 의 두 값을
+다음 export 의 since_id / since_comment_id 로 쓰면 됨.
+
+댓글은 export 시작 시점의 최대 댓글 id(high-water mark) 까지만 내보내고 그 값을 last_comment_id 로 줌.
+(도중에 이미 지나간 글에 달린 댓글이 있어도 다음 export 가 mark 이후부터 다시 훑으므로 빠지지 않음)
+
+visible_only=True (HTTP export) 면 검수 통과한 댓글만 내보냄.
+이때 mark 는 가장 오래된 검수 대기 댓글 바로 앞까지로 잡아서, 나중에 통과하는 댓글도 다음 export 에 나오게 함.
+CLI 는 숨김/대기 댓글까지 전부 내보냄 (운영자 백업용).
+
+CLI:
+    python -m app.core.export --since-id 0 --since-comment-id 0 --out posts.ndjson
+"""
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..db_models import Comment, Post, User
+
+BATCH_SIZE = 500
+
+STATUS_PENDING = "pending"
+STATUS_VISIBLE = "visible"
+
+
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    return dt.isoformat() if dt else None
+
+
+def _line(obj: dict) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _comment_obj(c, nickname) -> dict:
+    return {
+        "id": c.id,
+        "author_id": c.author_id,
+        "author": nickname(c.author_id),
+        "content": c.content,
+        "created_at": _iso(c.created_at),
+        "moderation_status": c.moderation_status,
+    }
+
+
+def _comment_columns():
+    return (
+        Comment.id,
+        Comment.post_id,
+        Comment.author_id,
+        Comment.content,
+        Comment.created_at,
+        Comment.moderation_status,
+    )
+
+
+def _nicknames(db: Session, author_ids) -> dict:
+    # 덤프 중 한 번 보고 마는 사용자들이라 user_cache 를 밀어내지 않게 직접 조회
+    return dict(db.query(User.id, User.nickname).filter(User.id.in_(author_ids)).all())
+
+
+def _comment_high_water(db: Session, since_comment_id: int, visible_only: bool) -> int:
+    """이번 export 에서 내보낼 댓글 id 상한"""
+    mark = db.query(func.max(Comment.id)).scalar() or 0
+    if visible_only:
+        oldest_pending = (
+            db.query(func.min(Comment.id))
+            .filter(Comment.moderation_status == STATUS_PENDING)
+            .scalar()
+        )
+        if oldest_pending is not None:
+            mark = min(mark, oldest_pending - 1)
+    return max(mark, since_comment_id)
+
+
+def iter_export(
+    db: Session,
+    since_id: int = 0,
+    since_comment_id: int = 0,
+    batch_size: int = BATCH_SIZE,
+    visible_only: bool = False,
+) -> Iterator[bytes]:
+    last_id = since_id
+    last_comment_id = _comment_high_water(db, since_comment_id, visible_only)
+    count = 0
+    comment_count = 0
+
+    comment_filters = [Comment.id <= last_comment_id]
+    if visible_only:
+        comment_filters.append(Comment.moderation_status == STATUS_VISIBLE)
+
+    while True:
+        posts = (
+            db.query(
+                Post.id,
+                Post.title,
+                Post.body,
+                Post.author_id,
+                Post.created_at,
+                Post.views,
+                Post.image_url,
+            )
+            .filter(Post.id > last_id)
+            .order_by(Post.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not posts:
+            break
+
+        post_ids = [p.id for p in posts]
+        comments_by_post = defaultdict(list)
+        for c in (
+            db.query(*_comment_columns())
+            .filter(Comment.post_id.in_(post_ids), *comment_filters)
+            .order_by(Comment.post_id.asc(), Comment.id.asc())
+        ):
+            comments_by_post[c.post_id].append(c)
+
+        author_ids = {p.author_id for p in posts}
+        for comments in comments_by_post.values():
+            author_ids.update(c.author_id for c in comments)
+        nickname = _nicknames(db, author_ids).get
+
+        chunk = []
+        for p in posts:
+            chunk.append(
+                _line(
+                    {
+                        "type": "post",
+                        "id": p.id,
+                        "title": p.title,
+                        "body": p.body,
+                        "author_id": p.author_id,
+                        "author": nickname(p.author_id),
+                        "created_at": _iso(p.created_at),
+                        "views": p.views or 0,
+                        "image_url": p.image_url,
+                        "comments": [
+                            _comment_obj(c, nickname) for c in comments_by_post.get(p.id, [])
+                        ],
+                    }
+                )
+            )
+        yield b"".join(chunk)
+
+        count += len(posts)
+        last_id = posts[-1].id
+        # 배치 사이에 읽기 트랜잭션을 끝내서 SQLite 쓰기를 오래 막지 않음
+        db.rollback()
+
+    # 이전 export 에서 이미 받아간 게시글에 그 뒤로 달린 댓글
+    cursor = since_comment_id
+    while since_id > 0:
+        comments = (
+            db.query(*_comment_columns())
+            .filter(Comment.id > cursor, Comment.post_id <= since_id, *comment_filters)
+            .order_by(Comment.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not comments:
+            break
+
+        nickname = _nicknames(db, {c.author_id for c in comments}).get
+        yield b"".join(
+            _line({"type": "comment", "post_id": c.post_id, **_comment_obj(c, nickname)})
+            for c in comments
+        )
+
+        comment_count += len(comments)
+        cursor = comments[-1].id
+        db.rollback()
+
+    yield _line(
+        {
+            "type": "end",
+            "since_id": since_id,
+            "last_id": last_id,
+            "count": count,
+            "since_comment_id": since_comment_id,
+            "last_comment_id": last_comment_id,
+            "comment_count": comment_count,
+        }
+    )
+
+
+def stream_export(
+    since_id: int = 0, since_comment_id: int = 0, visible_only: bool = False
+) -> Iterator[bytes]:
+    """StreamingResponse 용: 요청 세션과 별개로 자기 세션을 열고 닫음"""
+    db = SessionLocal()
+    try:
+        yield from iter_export(db, since_id, since_comment_id, visible_only=visible_only)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글/댓글 NDJSON export")
+    parser.add_argument("--since-id", type=int, default=0, help="이 id 보다 큰 게시글만")
+    parser.add_argument(
+        "--since-comment-id", type=int, default=0,
+        help="since_id 이하 게시글에 달린 댓글 중 이 id 보다 큰 것만",
+    )
+    parser.add_argument("--out", default="-", help="출력 파일 (기본: stdout)")
+    args = parser.parse_args()
+
+    out = sys.stdout.buffer if args.out == "-" else open(args.out, "wb")
+    try:
+        for chunk in stream_export(args.since_id, args.since_comment_id):
+            out.write(chunk)
+        out.flush()
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
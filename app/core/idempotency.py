@@ -0,0 +1,270 @@
+# backend/app/core/idempotency.py
+"""
+Idempotency-Key 처리 (모바일 클라이언트의 POST 재시도 대응).
+
+같은 키로 다시 들어온 요청은 처음 응답(상태코드 + 본문)을 그대로 돌려주고
+AI 검사 / DB insert / 파일 저장을 다시 하지 않음.
+
+- 응답은 idempotency_records 테이블에 만료 시각과 함께 저장 (개수 제한, 오래된 것부터 정리)
+- 최근 응답은 메모리 LRU 에도 올려둬서 재시도가 DB 를 거의 안 탐
+- 같은 키가 동시에 들어오면 먼저 온 요청이 끝날 때까지 기다렸다가 그 결과를 돌려줌
+  (같은 프로세스는 threading.Event, 다른 워커 프로세스는 DB 의 진행중 행을 폴링)
+- 5xx / 429 응답은 저장하지 않음 (일시적 에러라 재시도하면 성공할 수 있음)
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..db_models import IdempotencyRecord
+
+RECORD_TTL = timedelta(hours=24)
+IN_PROGRESS_TTL = timedelta(seconds=120)   # 진행중 행이 이보다 오래되면 죽은 요청으로 보고 넘겨받음
+WAIT_TIMEOUT_SECONDS = 60.0
+POLL_INTERVAL_SECONDS = 0.2
+MAX_RECORDS = 100000
+PURGE_EVERY = 500                          # insert 몇 번마다 만료 행 정리
+MEMORY_ENTRIES = 2000
+MAX_KEY_LEN = 200
+
+
+def _is_final(status: int) -> bool:
+    """재시도해도 같은 결과가 나올 응답만 저장"""
+    return status < 500 and status != 429
+
+
+def fingerprint(*parts) -> str:
+    """요청 내용 해시 (같은 키로 다른 내용을 보내면 거절하기 위해)"""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[tuple] = None   # (fingerprint, status_code, body)
+
+
+class IdempotencyStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._recent: "OrderedDict[str, tuple]" = OrderedDict()  # key → (만료, fingerprint, status, body)
+        self._inserts = 0
+        self.replays = 0
+
+    # ----- 메모리 캐시 ----- #
+    def _remember(self, key: str, fp: str, status: int, body: bytes, expires_at: datetime):
+        with self._lock:
+            self._recent[key] = (expires_at, fp, status, body)
+            self._recent.move_to_end(key)
+            while len(self._recent) > MEMORY_ENTRIES:
+                self._recent.popitem(last=False)
+
+    def _recall(self, key: str):
+        with self._lock:
+            entry = self._recent.get(key)
+            if entry is None:
+                return None
+            if entry[0] < datetime.utcnow():
+                del self._recent[key]
+                return None
+            self._recent.move_to_end(key)
+            return entry[1:]
+
+    # ----- DB ----- #
+    def _claim(self, db: Session, key: str, fp: str):
+        """
+        처리 권한을 가져오면 None, 이미 끝난 응답이 있으면 (fp, status, body),
+        다른 프로세스가 처리 중이면 "busy".
+        """
+        now = datetime.utcnow()
+        record = db.query(IdempotencyRecord).filter(IdempotencyRecord.key == key).first()
+        if record is not None:
+            if record.status_code is not None and record.expires_at >= now:
+                return record.fingerprint, record.status_code, record.response_body.encode("utf-8")
+            if record.status_code is None and record.expires_at >= now:
+                return "busy"
+            # 만료된 응답이나 죽은 진행중 행 → 넘겨받음
+            record.fingerprint = fp
+            record.status_code = None
+            record.response_body = None
+            record.created_at = now
+            record.expires_at = now + IN_PROGRESS_TTL
+            db.commit()
+            return None
+
+        db.add(
+            IdempotencyRecord(
+                key=key, fingerprint=fp, created_at=now, expires_at=now + IN_PROGRESS_TTL
+            )
+        )
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return "busy"
+        self._maybe_purge(db)
+        return None
+
+    def _maybe_purge(self, db: Session):
+        with self._lock:
+            self._inserts += 1
+            if self._inserts % PURGE_EVERY:
+                return
+        now = datetime.utcnow()
+        db.query(IdempotencyRecord).filter(IdempotencyRecord.expires_at < now).delete(
+            synchronize_session=False
+        )
+        # 그래도 너무 많으면 오래된 것부터 잘라냄
+        overflow = db.query(IdempotencyRecord).count() - MAX_RECORDS
+        if overflow > 0:
+            oldest = (
+                db.query(IdempotencyRecord.key)
+                .order_by(IdempotencyRecord.created_at.asc())
+                .limit(overflow)
+                .subquery()
+            )
+            db.query(IdempotencyRecord).filter(IdempotencyRecord.key.in_(oldest)).delete(
+                synchronize_session=False
+            )
+        db.commit()
+
+    def _store(self, db: Session, key: str, status: int, body: bytes):
+        record = db.query(IdempotencyRecord).filter(IdempotencyRecord.key == key).first()
+        if record is None:
+            return
+        if not _is_final(status):
+            db.delete(record)
+        else:
+            record.status_code = status
+            record.response_body = body.decode("utf-8")
+            record.expires_at = datetime.utcnow() + RECORD_TTL
+        db.commit()
+
+    def _wait_for_other_process(self, db: Session, key: str):
+        deadline = time.monotonic() + WAIT_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL_SECONDS)
+            db.expire_all()
+            record = db.query(IdempotencyRecord).filter(IdempotencyRecord.key == key).first()
+            if record is None:
+                return None  # 먼저 온 요청이 저장 안 되는 응답(5xx 등)으로 끝남
+            if record.status_code is not None:
+                return record.fingerprint, record.status_code, record.response_body.encode("utf-8")
+        return "timeout"
+
+    # ----- 진입점 ----- #
+    def execute(
+        self, db: Session, scope: str, key: str, fp: str, run: Callable[[], Response]
+    ) -> Response:
+        """
+        scope: 키가 겹치지 않게 붙이는 접두사 (예: "create_post:{user_id}")
+        run: 실제 처리 함수 (처음 요청일 때만 호출됨)
+        """
+        key = (key or "").strip()
+        if not key or len(key) > MAX_KEY_LEN:
+            return JSONResponse(
+                status_code=400,
+                content={"message": "invalid_idempotency_key", "data": None},
+            )
+        key = f"{scope}:{key}"
+
+        while True:
+            stored = self._recall(key)
+            if stored is not None:
+                return self._replay(fp, *stored)
+
+            # 같은 프로세스 안의 동시 요청
+            with self._lock:
+                flight = self._inflight.get(key)
+                owner = flight is None
+                if owner:
+                    flight = self._inflight[key] = _InFlight()
+
+            if not owner:
+                if not flight.done.wait(WAIT_TIMEOUT_SECONDS):
+                    return self._in_progress()
+                if flight.result is None:
+                    continue  # 먼저 온 요청이 실패 → 다시 시도
+                return self._replay(fp, *flight.result)
+
+            try:
+                claimed = self._claim(db, key, fp)
+                if claimed == "busy":
+                    claimed = self._wait_for_other_process(db, key)
+                    if claimed == "timeout":
+                        return self._in_progress()
+                    if claimed is None:
+                        continue
+                if claimed is not None:
+                    stored_fp, status, body = claimed
+                    self._remember(key, stored_fp, status, body, datetime.utcnow() + RECORD_TTL)
+                    flight.result = (stored_fp, status, body)
+                    return self._replay(fp, stored_fp, status, body)
+
+                try:
+                    response = run()
+                except Exception:
+                    # 진행중 행을 지워서 재시도가 기다리지 않게 함
+                    db.rollback()
+                    self._store(db, key, 500, b"")
+                    raise
+                status, body = response.status_code, bytes(response.body)
+                try:
+                    self._store(db, key, status, body)
+                except Exception:
+                    db.rollback()
+                    raise
+                if _is_final(status):
+                    self._remember(key, fp, status, body, datetime.utcnow() + RECORD_TTL)
+                    flight.result = (fp, status, body)
+                return response
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                flight.done.set()
+
+    def _replay(self, fp: str, stored_fp: str, status: int, body: bytes) -> Response:
+        if stored_fp != fp:
+            return JSONResponse(
+                status_code=422,
+                content={"message": "idempotency_key_reused", "data": None},
+            )
+        with self._lock:
+            self.replays += 1
+        return Response(
+            content=body,
+            status_code=status,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    @staticmethod
+    def _in_progress() -> Response:
+        return JSONResponse(
+            status_code=409,
+            content={"message": "request_in_progress", "data": None},
+            headers={"Retry-After": "1"},
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._inflight),
+                "cached": len(self._recent),
+                "replays": self.replays,
+            }
+
+
+# 프로세스 전역 저장소
+idempotency_store = IdempotencyStore()
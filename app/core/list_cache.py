@@ -0,0 +1,106 @@
+# backend/app/core/list_cache.py
+"""
+GET /posts 앞쪽 페이지 응답 캐시 (JSON 인코딩까지 끝난 bytes 를 그대로 저장).
+
+트래픽 대부분이 앞쪽 몇 페이지라서, 캐시에 있으면 쿼리 / make_list_item / JSON 인코딩 없이
+dict 조회 한 번으로 응답함.
+
+- (cursor, limit) 별로 저장, cursor 가 HEAD_CURSOR_LIMIT 보다 작은 페이지만 캐시
+- 전체 바이트 수 제한 + LRU 제거
+- 글 작성 / 회원 탈퇴(글·댓글 삭제) → 모든 페이지에 total 이 들어 있으므로 전부 무효화
+- 댓글이 검수 통과해 보이게 되면 → 그 글이 들어 있는 페이지만 무효화
+- 조회수는 상세 조회마다 바뀌므로 짧은 TTL 로 오래된 값이 남는 시간만 제한
+  (다른 워커 프로세스에서 일어난 변경도 TTL 안에 반영됨)
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+HEAD_CURSOR_LIMIT = 50        # cursor 가 이 값 미만인 페이지만 캐시
+MAX_LIMIT = 50                # limit 이 너무 큰 요청은 캐시 안 함
+MAX_BYTES = 4 * 1024 * 1024   # 캐시 전체 크기 제한
+TTL_SECONDS = 10.0
+
+
+class ListPageCache:
+    def __init__(self, max_bytes: int = MAX_BYTES, ttl: float = TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # (cursor, limit) → (만료시각, body, post_ids)
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cacheable(cursor: int, limit: int) -> bool:
+        return 0 <= cursor < HEAD_CURSOR_LIMIT and 0 < limit <= MAX_LIMIT
+
+    def _drop(self, key):
+        # lock 안에서 호출
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def get(self, cursor: int, limit: int) -> Optional[bytes]:
+        key = (cursor, limit)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def generation(self) -> int:
+        """렌더링 시작 전에 받아두고 put 에 넘김 (그 사이 무효화됐으면 저장 안 함)"""
+        with self._lock:
+            return self._generation
+
+    def put(self, cursor: int, limit: int, generation: int, body: bytes, post_ids: Iterable[int]):
+        if len(body) > self.max_bytes:
+            return
+        key = (cursor, limit)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, body, frozenset(post_ids))
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+
+    def invalidate_all(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def invalidate_posts(self, post_ids: Iterable[int]):
+        post_ids = set(post_ids)
+        if not post_ids:
+            return
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, e in self._entries.items() if e[2] & post_ids]:
+                self._drop(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# 프로세스 전역 캐시
+list_page_cache = ListPageCache()
@@ -0,0 +1,206 @@
+# backend/app/core/moderation_worker.py
+"""
+댓글 비동기 검수 워커.
+
+댓글은 작성 즉시 pending 상태로 저장되고 moderation_queue 에 들어감.
+이 워커가 백그라운드 스레드에서 대기열을 배치 단위로 꺼내
+check_toxic_batch 로 검사한 뒤 visible / hidden 으로 바꿔줌.
+"""
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..db_models import Comment, ModerationQueue
+from ..schemas import post_schema
+from .list_cache import list_page_cache
+from .pubsub import post_events
+from .trending import post_trending
+from .user_cache import user_cache
+
+COMMENT_TOXIC_THRESHOLD = 0.7
+
+BATCH_SIZE = 32           # 한 번에 모델에 넣을 댓글 수
+POLL_INTERVAL = 1.0       # 대기열이 비었을 때 쉬는 시간(초)
+LEASE_SECONDS = 60        # 워커가 잡은 행을 다른 워커가 못 가져가게 막는 시간
+RETRY_BASE_SECONDS = 5    # AI 에러 후 재시도 간격 (실패할 때마다 2배)
+RETRY_MAX_SECONDS = 600   # 재시도 간격 상한
+MODEL_UNAVAILABLE_RETRY_SECONDS = 30  # 모델을 아예 못 쓰는 동안의 재시도 간격
+
+STATUS_PENDING = "pending"
+STATUS_VISIBLE = "visible"
+STATUS_HIDDEN = "hidden"
+
+_thread = None
+_stop_event = threading.Event()
+
+
+# ---------- 대기열 넣기 ---------- #
+def enqueue_comment(db: Session, comment: Comment):
+    """댓글 작성 트랜잭션 안에서 호출 (commit 은 호출한 쪽에서)"""
+    comment.moderation_status = STATUS_PENDING
+    db.add(ModerationQueue(comment_id=comment.id))
+
+
+def retry_delay(attempts: int) -> float:
+    """실패 횟수에 따른 지수 백오프"""
+    return min(RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), RETRY_MAX_SECONDS)
+
+
+# ---------- 배치 처리 ---------- #
+def _claim_batch(db: Session, limit: int):
+    """잠기지 않은 대기열 행을 오래된 순서로 잡아옴"""
+    now = datetime.utcnow()
+    candidates = (
+        db.query(ModerationQueue)
+        .filter(or_(ModerationQueue.locked_until.is_(None), ModerationQueue.locked_until < now))
+        .order_by(ModerationQueue.id.asc())
+        .limit(limit)
+        .all()
+    )
+
+    claimed = []
+    lease = now + timedelta(seconds=LEASE_SECONDS)
+    for entry in candidates:
+        # 여러 워커 프로세스가 같은 행을 잡지 않도록 조건부 UPDATE 로 선점
+        updated = (
+            db.query(ModerationQueue)
+            .filter(
+                ModerationQueue.id == entry.id,
+                or_(ModerationQueue.locked_until.is_(None), ModerationQueue.locked_until < now),
+            )
+            .update({"locked_until": lease}, synchronize_session=False)
+        )
+        if updated:
+            claimed.append(entry)
+    db.commit()
+    return claimed
+
+
+def process_batch(db: Session, limit: int = BATCH_SIZE) -> int:
+    """대기열에서 최대 limit 개를 검사. 처리한 개수를 리턴."""
+    # 무거운 모델 import 는 실제로 검사할 때까지 미룸
+    from ..AI.ai_model import check_toxic_batch
+
+    entries = _claim_batch(db, limit)
+    if not entries:
+        return 0
+
+    comment_ids = [e.comment_id for e in entries]
+    comments = {
+        c.id: c for c in db.query(Comment).filter(Comment.id.in_(comment_ids)).all()
+    }
+
+    # 그 사이 삭제된 댓글은 대기열에서만 지움
+    live_entries = []
+    for e in entries:
+        if e.comment_id in comments:
+            live_entries.append(e)
+        else:
+            db.delete(e)
+
+    approved = []
+    results = check_toxic_batch(
+        [comments[e.comment_id].content for e in live_entries],
+        threshold=COMMENT_TOXIC_THRESHOLD,
+    )
+
+    for entry, result in zip(live_entries, results):
+        comment = comments[entry.comment_id]
+        if result["success"]:
+            comment.moderation_status = STATUS_HIDDEN if result["is_toxic"] else STATUS_VISIBLE
+            comment.moderation_score = result["score"]
+            db.delete(entry)
+            if not result["is_toxic"]:
+                approved.append(comment)
+            continue
+
+        # AI 에러: 댓글은 pending 그대로 두고 백오프 후 다시 시도
+        # (검수 못 한 댓글을 숨겨버리면 모델 장애 동안 들어온 댓글이 전부 사라짐)
+        entry.last_error = (result.get("error") or "ai_error")[:255]
+        if result.get("model_unavailable"):
+            # 모델 로딩 실패 / 모델 서버 다운은 댓글 탓이 아니므로 시도 횟수에 넣지 않음
+            delay = MODEL_UNAVAILABLE_RETRY_SECONDS
+        else:
+            entry.attempts = (entry.attempts or 0) + 1
+            delay = retry_delay(entry.attempts)
+        entry.locked_until = datetime.utcnow() + timedelta(seconds=delay)
+
+    db.commit()
+
+    # 검수 통과한 댓글이 있는 글의 목록 페이지 캐시 무효화 (댓글 수가 바뀜)
+    list_page_cache.invalidate_posts({c.post_id for c in approved})
+
+    # 검수 통과한 댓글을 실시간 구독자에게 알림 (commit 이후에)
+    authors = user_cache.get_many(db, {c.author_id for c in approved}) if approved else {}
+    for comment in approved:
+        post_trending.record_comment(comment.post_id)
+        author = authors.get(comment.author_id)
+        nickname = author.nickname if author else "unknown"
+        post_events.publish(
+            comment.post_id,
+            "comment_created",
+            post_schema.make_comment_out(comment, nickname).dict(),
+        )
+
+    return len(entries)
+
+
+# ---------- 지표 ---------- #
+def queue_lag(db: Session) -> dict:
+    """대기 중인 댓글 수와 가장 오래 기다린 시간(초)"""
+    pending = db.query(ModerationQueue).count()
+    oldest = (
+        db.query(ModerationQueue.enqueued_at)
+        .order_by(ModerationQueue.enqueued_at.asc())
+        .first()
+    )
+    oldest_age = 0.0
+    if oldest and oldest[0]:
+        oldest_age = max((datetime.utcnow() - oldest[0]).total_seconds(), 0.0)
+
+    return {
+        "pending": pending,
+        "oldest_age_seconds": round(oldest_age, 3),
+        "worker_running": _thread is not None and _thread.is_alive(),
+    }
+
+
+# ---------- 스레드 관리 ---------- #
+def _run():
+    while not _stop_event.is_set():
+        db = SessionLocal()
+        try:
+            processed = process_batch(db)
+        except Exception:
+            import traceback
+
+            print("[moderation_worker] ERROR")
+            print(traceback.format_exc())
+            db.rollback()
+            processed = 0
+        finally:
+            db.close()
+
+        # 꽉 찬 배치를 처리했으면 바로 다음 배치, 아니면 잠깐 쉼
+        if processed < BATCH_SIZE:
+            _stop_event.wait(POLL_INTERVAL)
+
+
+def start():
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop_event.clear()
+    _thread = threading.Thread(target=_run, name="moderation-worker", daemon=True)
+    _thread.start()
+
+
+def stop(timeout: float = 5.0):
+    global _thread
+    _stop_event.set()
+    if _thread is not None:
+        _thread.join(timeout=timeout)
+    _thread = None
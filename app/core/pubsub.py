@@ -0,0 +1,152 @@
+# backend/app/core/pubsub.py
+"""
+게시글 단위 실시간 이벤트용 프로세스 내 pub/sub 허브 (SSE 스트림에서 사용).
+
+- 구독자마다 크기가 정해진 버퍼(deque)를 두고, 넘치면 오래된 이벤트를 버린 뒤
+  클라이언트에게 resync 이벤트를 보내 상세를 다시 받아가게 함
+- 이벤트는 발행할 때 한 번만 SSE 바이트로 직렬화해서 모든 구독자가 공유
+- 구독자는 이벤트가 올 때까지 asyncio.Event 로 잠들어 있어서 유휴 연결 비용이 거의 없음
+- 컨트롤러는 스레드풀에서 돌기 때문에 발행은 call_soon_threadsafe 로 이벤트 루프에 알림
+
+같은 프로세스 안의 구독자에게만 전달됨 (uvicorn 워커가 여러 개면 워커별로 따로).
+"""
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+BUFFER_SIZE = 32               # 구독자당 쌓아둘 최대 이벤트 수
+HEARTBEAT_SECONDS = 15.0       # 이벤트가 없을 때 연결 유지용 주석 전송 간격
+MAX_SUBSCRIBERS = 5000         # 프로세스 전체 동시 연결 수 제한
+MAX_SUBSCRIBERS_PER_POST = 1000
+
+HEARTBEAT_FRAME = b": ping\n\n"
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+
+
+def encode_event(event: str, data: Dict[str, Any]) -> bytes:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class Subscriber:
+    def __init__(self, topic: int, viewer_id: Optional[int] = None):
+        self.topic = topic
+        self.viewer_id = viewer_id
+        self.buffer = deque(maxlen=BUFFER_SIZE)
+        self.overflowed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def push(self, frame: bytes):
+        # hub 의 lock 안에서 호출됨
+        if len(self.buffer) == self.buffer.maxlen:
+            self.overflowed = True
+        self.buffer.append(frame)
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘 (서버 종료 중)
+                pass
+
+    async def frames(self, hub: "EventHub"):
+        """SSE 바이트 스트림 (StreamingResponse 에 넘김). 끝나면 구독 해제."""
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        try:
+            # 연결 직후 바로 한 번 보내서 프록시 버퍼링 없이 스트림이 열리게 함
+            yield HEARTBEAT_FRAME
+            while True:
+                pending = hub.drain(self)
+                if pending:
+                    yield b"".join(pending)
+                    continue
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT_FRAME
+                self._wakeup.clear()
+        finally:
+            hub.unsubscribe(self)
+
+
+class EventHub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._topics: Dict[int, set] = {}
+        self._count = 0
+        self.published = 0
+        self.rejected = 0
+
+    def subscribe(self, topic: int, viewer_id: Optional[int] = None) -> Optional[Subscriber]:
+        """연결 수 제한에 걸리면 None"""
+        with self._lock:
+            subs = self._topics.get(topic)
+            if self._count >= MAX_SUBSCRIBERS or (
+                subs is not None and len(subs) >= MAX_SUBSCRIBERS_PER_POST
+            ):
+                self.rejected += 1
+                return None
+            sub = Subscriber(topic, viewer_id)
+            self._topics.setdefault(topic, set()).add(sub)
+            self._count += 1
+            return sub
+
+    def unsubscribe(self, sub: Subscriber):
+        with self._lock:
+            subs = self._topics.get(sub.topic)
+            if not subs or sub not in subs:
+                return
+            subs.discard(sub)
+            self._count -= 1
+            if not subs:
+                del self._topics[sub.topic]
+
+    def drain(self, sub: Subscriber) -> list:
+        with self._lock:
+            frames = list(sub.buffer)
+            sub.buffer.clear()
+            if sub.overflowed:
+                sub.overflowed = False
+                frames.insert(0, RESYNC_FRAME)
+            return frames
+
+    def publish(
+        self,
+        topic: int,
+        event: str,
+        data: Dict[str, Any],
+        only_viewer_id: Optional[int] = None,
+    ) -> int:
+        """
+        topic 구독자들에게 이벤트 전달. only_viewer_id 를 주면 그 사용자에게만.
+        전달한 구독자 수를 리턴.
+        """
+        with self._lock:
+            subs = self._topics.get(topic)
+            if not subs:
+                return 0
+            frame = encode_event(event, data)
+            delivered = 0
+            for sub in subs:
+                if only_viewer_id is not None and sub.viewer_id != only_viewer_id:
+                    continue
+                sub.push(frame)
+                delivered += 1
+            self.published += 1
+            return delivered
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": self._count,
+                "topics": len(self._topics),
+                "published": self.published,
+                "rejected": self.rejected,
+            }
+
+
+# 프로세스 전역 허브 (게시글 id 를 topic 으로 사용)
+post_events = EventHub()
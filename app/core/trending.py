@@ -0,0 +1,291 @@
+# backend/app/core/trending.py
+"""
+인기글(trending) 랭킹.
+
+점수 = Σ weight × 2^(-(now - t_event) / HALF_LIFE)  (조회/댓글이 시간이 지날수록 감쇠)
+
+모든 글에 같은 비율로 감쇠가 걸리므로 순위만 보면 now 항은 공통 인수라서 빠짐.
+그래서 고정 기준 시각 EPOCH 에 대한 log 점수
+    key = log Σ weight × exp(λ (t_event - EPOCH))
+만 저장하면, 이벤트가 올 때 그 글 하나의 key 만 갱신하면 되고 나머지 글은 다시 계산할 필요가 없음.
+글들은 key 내림차순으로 정렬된 리스트에 들어 있어 상위 K개는 앞에서 K개 자르면 끝.
+
+메모리 랭킹은 주기적으로 post_trending_scores 테이블에 저장하고, 서버 시작 시 다시 읽어옴.
+(테이블이 비어 있으면 기존 조회수/댓글 수로 초기 점수를 만듦)
+
+워커 프로세스가 여러 개면 각자 자기가 받은 이벤트만 알고 있으므로 절대값을 덮어쓰면 안 됨.
+checkpoint 는 지난 저장 이후 들어온 이벤트의 log 합(delta)만 모아 두었다가
+한 트랜잭션 안에서 stored = log_add(stored, delta) 로 더해 넣고,
+저장 직후 테이블을 다시 읽어 다른 워커가 더한 점수까지 합쳐진 값으로 랭킹을 갱신함.
+"""
+import math
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..db_models import Comment, Post, PostTrendingScore
+
+HALF_LIFE_SECONDS = 12 * 60 * 60
+DECAY_RATE = math.log(2) / HALF_LIFE_SECONDS
+EPOCH = datetime(2024, 1, 1)
+
+VIEW_WEIGHT = 1.0
+COMMENT_WEIGHT = 5.0
+POST_WEIGHT = 1.0   # 새 글이 바로 랭킹에 들어가도록 주는 기본 점수
+
+CHECKPOINT_INTERVAL = 60.0
+
+_thread = None
+_stop_event = threading.Event()
+
+
+def _event_key(weight: float, at: Optional[datetime] = None) -> float:
+    at = at or datetime.utcnow()
+    return math.log(weight) + DECAY_RATE * (at - EPOCH).total_seconds()
+
+
+def _log_add(a: float, b: float) -> float:
+    # log(exp(a) + exp(b)) 를 overflow 없이 계산
+    if a < b:
+        a, b = b, a
+    return a + math.log1p(math.exp(b - a))
+
+
+class TrendingRanking:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys: Dict[int, float] = {}
+        # (-key, post_id) 오름차순 = 점수 내림차순
+        self._order: List[Tuple[float, int]] = []
+        # 지난 checkpoint 이후 들어온 이벤트의 log 합 (post_id → delta)
+        self._pending: Dict[int, float] = {}
+        self._removed: set = set()
+
+    # ----- 내부 ----- #
+    def _set_key(self, post_id: int, key: float):
+        old = self._keys.get(post_id)
+        if old is not None:
+            idx = bisect_left(self._order, (-old, post_id))
+            del self._order[idx]
+        self._keys[post_id] = key
+        insort(self._order, (-key, post_id))
+
+    # ----- 이벤트 ----- #
+    def record(self, post_id: int, weight: float, at: Optional[datetime] = None):
+        event_key = _event_key(weight, at)
+        with self._lock:
+            old = self._keys.get(post_id)
+            key = event_key if old is None else _log_add(old, event_key)
+            self._set_key(post_id, key)
+            pending = self._pending.get(post_id)
+            self._pending[post_id] = event_key if pending is None else _log_add(pending, event_key)
+            self._removed.discard(post_id)
+
+    def record_view(self, post_id: int):
+        self.record(post_id, VIEW_WEIGHT)
+
+    def record_comment(self, post_id: int):
+        self.record(post_id, COMMENT_WEIGHT)
+
+    def record_post(self, post_id: int, created_at: Optional[datetime] = None):
+        self.record(post_id, POST_WEIGHT, created_at)
+
+    def remove(self, post_ids: Iterable[int]):
+        with self._lock:
+            for post_id in post_ids:
+                old = self._keys.pop(post_id, None)
+                if old is None:
+                    continue
+                idx = bisect_left(self._order, (-old, post_id))
+                del self._order[idx]
+                self._pending.pop(post_id, None)
+                self._removed.add(post_id)
+
+    # ----- 조회 ----- #
+    def top(self, limit: int, offset: int = 0) -> List[int]:
+        with self._lock:
+            return [post_id for _, post_id in self._order[offset:offset + limit]]
+
+    def score(self, post_id: int, now: Optional[datetime] = None) -> float:
+        """현재 시각 기준 감쇠된 점수 (디버깅/표시용)"""
+        with self._lock:
+            key = self._keys.get(post_id)
+        if key is None:
+            return 0.0
+        now = now or datetime.utcnow()
+        return math.exp(key - DECAY_RATE * (now - EPOCH).total_seconds())
+
+    def __len__(self):
+        return len(self._keys)
+
+    # ----- 저장/복원 ----- #
+    def _replace_keys(self, rows: Iterable[Tuple[int, float]]):
+        """테이블에서 읽은 점수 + 아직 저장 안 한 delta 로 랭킹을 다시 만듦 (lock 안에서 호출)"""
+        keys = {post_id: key for post_id, key in rows if post_id not in self._removed}
+        for post_id, delta in self._pending.items():
+            old = keys.get(post_id)
+            keys[post_id] = delta if old is None else _log_add(old, delta)
+        self._keys = keys
+        self._order = sorted((-key, post_id) for post_id, key in keys.items())
+
+    def load(self, db: Session):
+        rows = db.query(PostTrendingScore.post_id, PostTrendingScore.log_score).all()
+        if not rows:
+            # 초기 점수는 없는 행만 넣음 (여러 워커가 동시에 시작해도 두 번 더해지지 않게)
+            now = datetime.utcnow()
+            for post_id, key in _bootstrap_keys(db):
+                db.execute(
+                    text(
+                        "INSERT OR IGNORE INTO post_trending_scores (post_id, log_score, updated_at) "
+                        "VALUES (:pid, :score, :now)"
+                    ),
+                    {"pid": post_id, "score": key, "now": now},
+                )
+            db.commit()
+            rows = db.query(PostTrendingScore.post_id, PostTrendingScore.log_score).all()
+        with self._lock:
+            self._pending.clear()
+            self._removed.clear()
+            self._replace_keys(rows)
+
+    def refresh(self, db: Session):
+        """다른 워커가 저장한 점수까지 합쳐진 테이블 값으로 랭킹 갱신"""
+        rows = db.query(PostTrendingScore.post_id, PostTrendingScore.log_score).all()
+        with self._lock:
+            self._replace_keys(rows)
+
+    def checkpoint(self, db: Session) -> int:
+        """
+        지난 checkpoint 이후 쌓인 delta 를 테이블 점수에 더함. 저장한 행 수를 리턴.
+        첫 쓰기 문장에서 SQLite 쓰기 잠금을 잡으므로 읽고-더하고-쓰는 동안 다른 워커가 끼어들지 못함.
+        """
+        with self._lock:
+            pending = self._pending
+            removed = self._removed
+            self._pending = {}
+            self._removed = set()
+
+        if not pending and not removed:
+            return 0
+
+        try:
+            now = datetime.utcnow()
+            if removed:
+                db.query(PostTrendingScore).filter(
+                    PostTrendingScore.post_id.in_(removed)
+                ).delete(synchronize_session=False)
+            for post_id, delta in pending.items():
+                # 행이 없으면 delta 로 새로 넣음 (그 사이 다른 워커가 지운 글이면 넣지 않음)
+                inserted = db.execute(
+                    text(
+                        "INSERT OR IGNORE INTO post_trending_scores (post_id, log_score, updated_at) "
+                        "SELECT :pid, :score, :now WHERE EXISTS (SELECT 1 FROM posts WHERE id = :pid)"
+                    ),
+                    {"pid": post_id, "score": delta, "now": now},
+                ).rowcount
+                if inserted:
+                    continue
+                stored = db.execute(
+                    text("SELECT log_score FROM post_trending_scores WHERE post_id = :pid"),
+                    {"pid": post_id},
+                ).scalar()
+                if stored is None:
+                    continue
+                db.execute(
+                    text(
+                        "UPDATE post_trending_scores SET log_score = :score, updated_at = :now "
+                        "WHERE post_id = :pid"
+                    ),
+                    {"pid": post_id, "score": _log_add(stored, delta), "now": now},
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 다음 checkpoint 때 다시 시도 (그 사이 쌓인 delta 와 합침)
+            with self._lock:
+                for post_id, delta in pending.items():
+                    if post_id not in self._keys:
+                        continue
+                    newer = self._pending.get(post_id)
+                    self._pending[post_id] = delta if newer is None else _log_add(newer, delta)
+                self._removed.update(removed)
+            raise
+        return len(pending) + len(removed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"posts": len(self._keys), "dirty": len(self._pending)}
+
+
+def _bootstrap_keys(db: Session) -> List[Tuple[int, float]]:
+    """저장된 점수가 없을 때: 글 작성 시각에 (조회수 + 댓글 수) 가 몰려 있었다고 보고 계산"""
+    comment_counts = dict(
+        db.query(Comment.post_id, func.count(Comment.id))
+        .filter(Comment.moderation_status == "visible")
+        .group_by(Comment.post_id)
+        .all()
+    )
+    keys = []
+    for post_id, views, created_at in db.query(Post.id, Post.views, Post.created_at).all():
+        weight = (
+            POST_WEIGHT
+            + VIEW_WEIGHT * (views or 0)
+            + COMMENT_WEIGHT * comment_counts.get(post_id, 0)
+        )
+        keys.append((post_id, _event_key(weight, created_at or EPOCH)))
+    return keys
+
+
+# 프로세스 전역 랭킹
+post_trending = TrendingRanking()
+
+
+# ---------- 주기적 저장 스레드 ---------- #
+def _checkpoint_once():
+    db = SessionLocal()
+    try:
+        post_trending.checkpoint(db)
+        post_trending.refresh(db)
+    except Exception:
+        import traceback
+
+        print("[trending] checkpoint ERROR")
+        print(traceback.format_exc())
+    finally:
+        db.close()
+
+
+def _run():
+    while not _stop_event.wait(CHECKPOINT_INTERVAL):
+        _checkpoint_once()
+
+
+def start():
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+
+    db = SessionLocal()
+    try:
+        post_trending.load(db)
+    finally:
+        db.close()
+
+    _stop_event.clear()
+    _thread = threading.Thread(target=_run, name="trending-checkpoint", daemon=True)
+    _thread.start()
+
+
+def stop(timeout: float = 5.0):
+    global _thread
+    _stop_event.set()
+    if _thread is not None:
+        _thread.join(timeout=timeout)
+    _thread = None
+    # 종료 직전 마지막 저장
+    _checkpoint_once()
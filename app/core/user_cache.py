@@ -0,0 +1,114 @@
+# backend/app/core/user_cache.py
+"""
+작성자 조회용 프로세스 내 사용자 캐시 (id → id / nickname / profile_image).
+
+글/댓글 작성, 상세 조회의 댓글 작성자 닉네임처럼 같은 몇 명의 사용자를
+계속 조회하는 경로에서 DB 쿼리를 줄이기 위해 사용.
+- 크기 제한 (LRU 로 오래 안 쓴 항목부터 제거)
+- TTL 이 지나면 다시 DB 에서 읽음 (다른 워커 프로세스에서 수정된 값도 TTL 안에 반영)
+- 회원정보 수정 / 비밀번호 변경 / 탈퇴 시 invalidate
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from ..db_models import User
+
+MAX_ENTRIES = 10000
+TTL_SECONDS = 30.0
+
+
+class CachedUser(NamedTuple):
+    id: int
+    nickname: str
+    profile_image: Optional[str]
+
+
+class UserCache:
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # id → (만료시각, CachedUser)
+        # invalidate / clear 마다 증가. DB 조회 중에 무효화가 있었으면 조회 결과를 캐시에 넣지 않음
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _get_cached(self, user_id: int, now: float) -> Optional[CachedUser]:
+        # lock 안에서 호출
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at < now:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return user
+
+    def _put(self, user: CachedUser, now: float):
+        # lock 안에서 호출
+        self._entries[user.id] = (now + self.ttl, user)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, db: Session, user_id: int) -> Optional[CachedUser]:
+        """없는 사용자면 None"""
+        return self.get_many(db, [user_id]).get(user_id)
+
+    def get_many(self, db: Session, user_ids: Iterable[int]) -> Dict[int, CachedUser]:
+        """캐시에 없는 것만 한 번의 쿼리로 가져옴"""
+        now = time.monotonic()
+        found: Dict[int, CachedUser] = {}
+        missing = set()
+        with self._lock:
+            for user_id in user_ids:
+                if user_id is None or user_id in found:
+                    continue
+                user = self._get_cached(user_id, now)
+                if user is None:
+                    missing.add(user_id)
+                else:
+                    found[user_id] = user
+            self.hits += len(found)
+            self.misses += len(missing)
+            generation = self._generation
+
+        if missing:
+            rows = (
+                db.query(User.id, User.nickname, User.profile_image)
+                .filter(User.id.in_(missing))
+                .all()
+            )
+            with self._lock:
+                # 조회하는 사이 invalidate 됐으면 읽은 값이 이미 옛날 값일 수 있으므로 저장 안 함
+                cacheable = generation == self._generation
+                for row in rows:
+                    user = CachedUser(row.id, row.nickname, row.profile_image)
+                    if cacheable:
+                        self._put(user, now)
+                    found[user.id] = user
+        return found
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# 프로세스 전역 캐시
+user_cache = UserCache()
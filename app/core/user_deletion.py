@@ -0,0 +1,297 @@
+# backend/app/core/user_deletion.py
+"""
+회원 탈퇴 시 게시글/댓글 일괄 삭제.
+
+db.delete(user) 는 ORM cascade 때문에 글/댓글을 전부 메모리에 올린 뒤 하나씩 지워서
+글이 많은 회원이면 느리고 SQLite 쓰기 잠금도 오래 잡음.
+여기서는 DELETE ... WHERE id IN (SELECT ... LIMIT n) 으로 청크 단위로 지우고
+청크마다 commit 해서 잠금을 짧게 끊어줌.
+"""
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..db_models import User, UserDeletionJob
+from .list_cache import list_page_cache
+from .trending import post_trending
+
+CHUNK_SIZE = 500
+# 글 + 댓글 수가 이보다 많으면 백그라운드 작업으로 넘김
+BACKGROUND_THRESHOLD = 2000
+POLL_INTERVAL = 2.0
+LEASE_SECONDS = 120       # 작업을 잡은 워커가 청크마다 연장. 워커가 죽으면 이 시간 뒤 다른 워커가 이어받음
+
+UPLOAD_URL_PREFIX = "/static/uploads/"
+UPLOAD_DIR = Path("app/static/uploads")
+
+_thread = None
+_stop_event = threading.Event()
+
+
+# ---------- 청크 삭제 SQL ---------- #
+# 삭제 순서: 검수 대기열 → 댓글 → 게시글 (자식부터)
+_CHUNK_DELETES = [
+    # 회원 글에 달린 댓글 / 회원이 쓴 댓글의 검수 대기열
+    """
+    DELETE FROM moderation_queue WHERE id IN (
+        SELECT q.id FROM moderation_queue q
+        JOIN comments c ON c.id = q.comment_id
+        WHERE c.author_id = :uid
+           OR c.post_id IN (SELECT id FROM posts WHERE author_id = :uid)
+        LIMIT :n
+    )
+    """,
+    # 회원 글에 달린 댓글 (다른 사람이 쓴 것 포함)
+    """
+    DELETE FROM comments WHERE id IN (
+        SELECT id FROM comments
+        WHERE post_id IN (SELECT id FROM posts WHERE author_id = :uid)
+        LIMIT :n
+    )
+    """,
+    # 회원이 다른 글에 쓴 댓글
+    """
+    DELETE FROM comments WHERE id IN (
+        SELECT id FROM comments WHERE author_id = :uid LIMIT :n
+    )
+    """,
+]
+
+
+def count_user_rows(db: Session, user_id: int) -> int:
+    """탈퇴 시 지워질 게시글 + 댓글 수 (대략적인 작업량)"""
+    row = db.execute(
+        text(
+            """
+            SELECT
+              (SELECT COUNT(*) FROM posts WHERE author_id = :uid)
+            + (SELECT COUNT(*) FROM comments WHERE author_id = :uid
+                  OR post_id IN (SELECT id FROM posts WHERE author_id = :uid))
+            """
+        ),
+        {"uid": user_id},
+    ).first()
+    return int(row[0] or 0)
+
+
+def _upload_path(url: Optional[str]) -> Optional[Path]:
+    """/static/uploads/xxx.jpg → app/static/uploads/xxx.jpg (업로드 파일만)"""
+    if not url or not url.startswith(UPLOAD_URL_PREFIX):
+        return None
+    name = url[len(UPLOAD_URL_PREFIX):]
+    if not name or "/" in name or name.startswith("."):
+        return None
+    return UPLOAD_DIR / name
+
+
+def remove_uploaded_files(urls):
+    for url in urls:
+        path = _upload_path(url)
+        if path is None:
+            continue
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"[Warning] 업로드 파일 삭제 실패 ({path}):", repr(e))
+
+
+def _delete_posts_chunk(db: Session, user_id: int, chunk_size: int):
+    """
+    게시글 한 청크 삭제. (삭제한 게시글 수, 삭제한 전체 행 수, 지울 이미지 URL 목록)
+    댓글 단계가 끝난 뒤에 달린 댓글이 남지 않도록 그 글들의 댓글 / 검수 대기열도 같은 트랜잭션에서 지움.
+    """
+    rows = db.execute(
+        text("SELECT id, image_url FROM posts WHERE author_id = :uid LIMIT :n"),
+        {"uid": user_id, "n": chunk_size},
+    ).all()
+    if not rows:
+        return 0, 0, []
+
+    ids = [r[0] for r in rows]
+    params = {f"p{i}": pid for i, pid in enumerate(ids)}
+    placeholders = ", ".join(f":p{i}" for i in range(len(ids)))
+    db.execute(
+        text(
+            f"""
+            DELETE FROM moderation_queue WHERE comment_id IN (
+                SELECT id FROM comments WHERE post_id IN ({placeholders})
+            )
+            """
+        ),
+        params,
+    )
+    comments = db.execute(text(f"DELETE FROM comments WHERE post_id IN ({placeholders})"), params)
+    db.execute(text(f"DELETE FROM post_trending_scores WHERE post_id IN ({placeholders})"), params)
+    db.execute(text(f"DELETE FROM posts WHERE id IN ({placeholders})"), params)
+    post_trending.remove(ids)
+    return len(ids), len(ids) + (comments.rowcount or 0), [r[1] for r in rows if r[1]]
+
+
+def delete_user_content(
+    db: Session,
+    user_id: int,
+    chunk_size: int = CHUNK_SIZE,
+    stop_event: Optional[threading.Event] = None,
+    on_chunk: Optional[Callable[[], None]] = None,
+) -> int:
+    """
+    회원의 게시글/댓글(+ 그 글에 달린 댓글)과 업로드 이미지를 청크 단위로 삭제.
+    청크마다 commit 하고, 이미지 파일은 해당 청크가 commit 된 뒤에 지움.
+    stop_event 가 set 되면 청크 사이에서 멈춤 (남은 건 다음 실행 때 이어서 삭제).
+    on_chunk 는 청크 commit 후마다 호출 (백그라운드 작업의 lease 연장용).
+    삭제한 행 수를 리턴.
+    """
+    deleted = 0
+
+    for sql in _CHUNK_DELETES:
+        while True:
+            result = db.execute(text(sql), {"uid": user_id, "n": chunk_size})
+            db.commit()
+            if result.rowcount:
+                list_page_cache.invalidate_all()
+            deleted += result.rowcount or 0
+            if on_chunk is not None:
+                on_chunk()
+            if not result.rowcount or result.rowcount < chunk_size:
+                break
+            if stop_event is not None and stop_event.is_set():
+                return deleted
+
+    while True:
+        count, rows, image_urls = _delete_posts_chunk(db, user_id, chunk_size)
+        db.commit()
+        if count:
+            list_page_cache.invalidate_all()
+        remove_uploaded_files(image_urls)
+        deleted += rows
+        if on_chunk is not None:
+            on_chunk()
+        if count < chunk_size:
+            break
+        if stop_event is not None and stop_event.is_set():
+            return deleted
+
+    return deleted
+
+
+def delete_user(db: Session, user: User) -> bool:
+    """
+    회원 탈퇴 처리. 바로 끝났으면 True, 백그라운드 작업으로 넘겼으면 False.
+    """
+    # 프로필 이미지 파일은 지우지 않음: users.profile_image 는 클라이언트가 보낸 값 그대로라
+    # 다른 사람 업로드 파일을 가리킬 수 있음 (서버가 올려준 파일이라는 보장이 없음)
+    user_id = user.id
+
+    if count_user_rows(db, user_id) > BACKGROUND_THRESHOLD:
+        # users 행만 먼저 지우고 (로그인/조회 즉시 차단) 나머지는 작업으로 등록
+        db.execute(text("DELETE FROM users WHERE id = :uid"), {"uid": user_id})
+        db.add(UserDeletionJob(user_id=user_id))
+        db.commit()
+        return False
+
+    delete_user_content(db, user_id)
+    db.execute(text("DELETE FROM users WHERE id = :uid"), {"uid": user_id})
+    db.commit()
+    return True
+
+
+# ---------- 백그라운드 작업 ---------- #
+def _claim_next_job(db: Session) -> Optional[UserDeletionJob]:
+    """아무도 안 잡은 (또는 lease 가 끝난) 작업 하나를 조건부 UPDATE 로 선점"""
+    now = datetime.utcnow()
+    unlocked = or_(UserDeletionJob.locked_until.is_(None), UserDeletionJob.locked_until < now)
+    candidates = (
+        db.query(UserDeletionJob.id)
+        .filter(UserDeletionJob.finished_at.is_(None), unlocked)
+        .order_by(UserDeletionJob.id.asc())
+        .all()
+    )
+    for (job_id,) in candidates:
+        # 여러 워커 프로세스가 같은 작업을 잡지 않도록
+        updated = (
+            db.query(UserDeletionJob)
+            .filter(
+                UserDeletionJob.id == job_id,
+                UserDeletionJob.finished_at.is_(None),
+                unlocked,
+            )
+            .update(
+                {"locked_until": now + timedelta(seconds=LEASE_SECONDS)},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if updated:
+            return db.get(UserDeletionJob, job_id)
+    return None
+
+
+def _extend_lease(db: Session, job_id: int):
+    db.query(UserDeletionJob).filter(UserDeletionJob.id == job_id).update(
+        {"locked_until": datetime.utcnow() + timedelta(seconds=LEASE_SECONDS)},
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def process_pending_jobs(db: Session) -> int:
+    """남아 있는 탈퇴 작업을 하나씩 잡아서 처리. 끝낸 작업 수를 리턴."""
+    done = 0
+    while not _stop_event.is_set():
+        job = _claim_next_job(db)
+        if job is None:
+            break
+        job_id, user_id = job.id, job.user_id
+        deleted = delete_user_content(
+            db,
+            user_id,
+            stop_event=_stop_event,
+            on_chunk=lambda: _extend_lease(db, job_id),
+        )
+        job = db.get(UserDeletionJob, job_id)
+        job.deleted_rows = (job.deleted_rows or 0) + deleted
+        if not _stop_event.is_set():
+            job.finished_at = datetime.utcnow()
+            done += 1
+        # 중간에 멈췄으면 lease 를 풀어서 다른 워커가 바로 이어받게 함
+        job.locked_until = None
+        db.commit()
+    return done
+
+
+def _run():
+    while not _stop_event.is_set():
+        db = SessionLocal()
+        try:
+            process_pending_jobs(db)
+        except Exception:
+            import traceback
+
+            print("[user_deletion] ERROR")
+            print(traceback.format_exc())
+            db.rollback()
+        finally:
+            db.close()
+        _stop_event.wait(POLL_INTERVAL)
+
+
+def start():
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop_event.clear()
+    _thread = threading.Thread(target=_run, name="user-deletion-worker", daemon=True)
+    _thread.start()
+
+
+def stop(timeout: float = 5.0):
+    global _thread
+    _stop_event.set()
+    if _thread is not None:
+        _thread.join(timeout=timeout)
+    _thread = None
@@ -19,3 +19,35 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ---------- 간단 마이그레이션 ---------- #
+# create_all 은 이미 있는 테이블에 새 컬럼을 추가해주지 않기 때문에
+# 기존 app.db 에 필요한 컬럼만 ALTER TABLE 로 붙여줌
+_ADDED_COLUMNS = [
+    ("comments", "moderation_status", "VARCHAR(20) NOT NULL DEFAULT 'visible'"),
+    ("comments", "moderation_score", "FLOAT"),
+    ("user_deletion_jobs", "locked_until", "DATETIME"),
+]
+
+
+def run_migrations():
+    """init_db 에서 호출. 직접 부를 필요 없음"""
+    with engine.begin() as conn:
+        for table, column, ddl in _ADDED_COLUMNS:
+            existing = {
+                row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")
+            }
+            if existing and column not in existing:
+                conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+
+
+def init_db():
+    """
+    테이블 생성 + 마이그레이션.
+    import 시점이 아니라 서버 시작(startup) 또는 `python -m app.manage init-db` 에서 명시적으로 실행.
+    """
+    from . import db_models  # noqa: F401 (테이블 메타데이터 등록)
+
+    Base.metadata.create_all(bind=engine)
+    run_migrations()
@@ -7,6 +7,7 @@ from sqlalchemy import (
     String,
     Text,
     DateTime,
+    Float,
     ForeignKey,
     UniqueConstraint,
 )
@@ -60,5 +61,67 @@ class Comment(Base):
     content = Column(String(500), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # 댓글 검수 상태: pending(검수 대기) / visible(노출) / hidden(혐오로 숨김)
+    # 예전 데이터는 검수 없이 들어갔으므로 visible 로 취급
+    moderation_status = Column(
+        String(20), nullable=False, default="visible", server_default="visible", index=True
+    )
+    moderation_score = Column(Float, nullable=True)
+
     post = relationship("Post", back_populates="comments")
     author = relationship("User", back_populates="comments")
+
+
+class ModerationQueue(Base):
+    """
+    댓글 비도덕성 검사 대기열 (DB 테이블이라 서버가 재시작돼도 유지됨)
+    백그라운드 워커가 locked_until 으로 행을 잡아가서 배치로 검사함.
+    """
+    __tablename__ = "moderation_queue"
+
+    id = Column(Integer, primary_key=True, index=True)
+    comment_id = Column(Integer, ForeignKey("comments.id"), nullable=False, unique=True)
+    enqueued_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(String(255), nullable=True)
+
+
+class UserDeletionJob(Base):
+    """
+    게시글/댓글이 많은 회원의 탈퇴 작업 (백그라운드에서 청크 단위로 삭제)
+    users 행은 탈퇴 요청 때 바로 지우고, 남은 글/댓글/이미지를 여기 기록된 user_id 로 정리함.
+    """
+    __tablename__ = "user_deletion_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    deleted_rows = Column(Integer, default=0, nullable=False)
+    # 작업을 잡은 워커가 처리 중인 동안 다른 워커가 못 가져가게 막는 시각
+    locked_until = Column(DateTime, nullable=True)
+
+
+class PostTrendingScore(Base):
+    """인기글 랭킹 저장용 (메모리 랭킹을 주기적으로 저장, 서버 시작 시 복원)"""
+    __tablename__ = "post_trending_scores"
+
+    post_id = Column(Integer, primary_key=True)
+    log_score = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class IdempotencyRecord(Base):
+    """
+    Idempotency-Key 로 들어온 요청의 응답 저장 (재시도 시 그대로 돌려줌)
+    status_code 가 NULL 이면 아직 처리 중인 요청
+    """
+    __tablename__ = "idempotency_records"
+
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -1,16 +1,41 @@
 # backend/app/main.py
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from .database import Base, engine
-from . import db_models  # noqa: F401 (테이블 생성 위해 import)
-from .routers import post_router, user_router
-
-# 테이블 생성
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="CommunityProject API")
+from .database import init_db
+from .AI import ai_model
+from .core import moderation_worker, trending, user_deletion
+from .routers import metrics_router, post_router, user_router
+
+# 테이블 생성/마이그레이션은 import 시점이 아니라 startup 에서 실행.
+# 운영에서는 배포 때 `python -m app.manage init-db` 를 한 번 돌리고 AUTO_INIT_DB=0 으로 끄면
+# 워커마다 스키마 확인을 반복하지 않음.
+AUTO_INIT_DB = os.environ.get("AUTO_INIT_DB", "1") != "0"
+
+
+# 백그라운드 워커 (댓글 검수, 회원 탈퇴 정리, 인기글 랭킹 저장) 시작/종료
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if AUTO_INIT_DB:
+        init_db()
+    # MODEL_PRELOAD=1 이면 첫 요청 전에 모델을 미리 로딩
+    ai_model.warmup()
+    trending.start()
+    moderation_worker.start()
+    user_deletion.start()
+    try:
+        yield
+    finally:
+        moderation_worker.stop()
+        user_deletion.stop()
+        trending.stop()
+
+
+app = FastAPI(title="CommunityProject API", lifespan=lifespan)
 
 # CORS 설정 (프론트엔드 주소에 맞춰 수정)
 origins = [
@@ -31,4 +56,5 @@ app.mount("/static", StaticFiles(directory="app/static"), name="static")
 # 라우터 등록
 app.include_router(user_router.router)
 app.include_router(post_router.router)
+app.include_router(metrics_router.router)
 
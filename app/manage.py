@@ -0,0 +1,114 @@
+# backend/app/manage.py
+"""
+관리용 CLI.
+
+    python -m app.manage init-db
+        테이블 생성 + 마이그레이션 (배포 때 한 번. 그 뒤 워커는 AUTO_INIT_DB=0 으로 실행)
+
+    python -m app.manage import-time [--budget-ms 1500] [--top 15] [--repeat 3]
+        `python -X importtime -c "import app.main"` 으로 앱 import 비용을 재고
+        예산을 넘거나 무거운 모듈(transformers, torch 등)이 import 시점에 딸려오면 실패(exit 1).
+        CI 에서 기동 시간 회귀 체크용.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "1500"))
+IMPORT_TARGET = "app.main"
+# 첫 사용 때까지 import 를 미뤄야 하는 모듈 (import 시점에 보이면 실패)
+FORBIDDEN_AT_IMPORT = ("transformers", "torch", "tensorflow")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def init_db_command(args) -> int:
+    from .database import init_db
+
+    init_db()
+    print("[init-db] ok")
+    return 0
+
+
+def measure_import_time(target: str = IMPORT_TARGET):
+    """(전체 누적 시간 us, [(누적 us, 자체 us, 모듈명)], import 된 모듈 이름 set)"""
+    project_root = Path(__file__).resolve().parent.parent
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {target} 실패:\n{proc.stderr[-2000:]}")
+
+    total_us = None
+    entries = []
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, name = int(m.group(1)), int(m.group(2)), m.group(3), m.group(4)
+        entries.append((cumulative_us, self_us, name))
+        # 들여쓰기가 한 칸(최상위)인 target 줄이 전체 import 비용
+        if name == target and len(indent) == 1:
+            total_us = cumulative_us
+
+    if total_us is None:
+        raise RuntimeError(f"importtime 출력에서 {target} 를 찾지 못함")
+    return total_us, entries, {name for _, _, name in entries}
+
+
+def import_time_command(args) -> int:
+    # 측정값이 흔들리므로 여러 번 재서 가장 빠른 값으로 판단
+    runs = [measure_import_time(args.target) for _ in range(max(1, args.repeat))]
+    total_us, entries, modules = min(runs, key=lambda r: r[0])
+    total_ms = total_us / 1000
+
+    print(f"[import-time] import {args.target}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"[import-time] 누적 시간 상위 {args.top}개 모듈:")
+    for cumulative_us, self_us, name in sorted(entries, reverse=True)[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {name}")
+
+    failed = False
+    heavy = sorted(
+        name for name in modules
+        if name.split(".")[0] in FORBIDDEN_AT_IMPORT
+    )
+    if heavy:
+        roots = sorted({name.split(".")[0] for name in heavy})
+        print(f"[import-time] FAIL: import 시점에 무거운 모듈이 로딩됨: {', '.join(roots)}")
+        failed = True
+
+    if total_ms > args.budget_ms:
+        print(f"[import-time] FAIL: 예산 초과 ({total_ms:.1f} ms > {args.budget_ms:.0f} ms)")
+        failed = True
+
+    if not failed:
+        print("[import-time] ok")
+    return 1 if failed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.manage")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_init = sub.add_parser("init-db", help="테이블 생성 + 마이그레이션")
+    p_init.set_defaults(func=init_db_command)
+
+    p_import = sub.add_parser("import-time", help="앱 import 시간 측정 + 예산 체크")
+    p_import.add_argument("--budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS)
+    p_import.add_argument("--top", type=int, default=15)
+    p_import.add_argument("--repeat", type=int, default=3)
+    p_import.add_argument("--target", default=IMPORT_TARGET)
+    p_import.set_defaults(func=import_time_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+# backend/app/routers/metrics_router.py
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from ..core import admission, moderation_worker
+from ..core.idempotency import idempotency_store
+from ..core.list_cache import list_page_cache
+from ..core.pubsub import post_events
+from ..core.trending import post_trending
+from ..core.user_cache import user_cache
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+def get_metrics(db: Session = Depends(get_db)):
+    return JSONResponse(
+        status_code=200,
+        content={
+            "message": "metrics_ok",
+            "data": {
+                # 댓글 검수 대기열 지연
+                "moderation_queue": moderation_worker.queue_lag(db),
+                # 실시간 댓글 스트림 연결 현황
+                "post_events": post_events.stats(),
+                "trending": post_trending.stats(),
+                "user_cache": user_cache.stats(),
+                "list_page_cache": list_page_cache.stats(),
+                "idempotency": idempotency_store.stats(),
+                # 쓰기 요청 부하 제어
+                "admission": admission.stats(),
+            },
+        },
+    )
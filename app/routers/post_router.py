@@ -4,11 +4,13 @@ from pathlib import Path
 import uuid
 import shutil
 
-from fastapi import APIRouter, Depends, Form, File, UploadFile
+from fastapi import APIRouter, Depends, Form, File, Header, UploadFile
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..controllers import post_controller
+from ..core import idempotency
+from ..core.idempotency import idempotency_store
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
@@ -20,43 +22,74 @@ def list_posts(cursor: int = 0, limit: int = 10, db: Session = Depends(get_db)):
     return post_controller.list_posts_controller(db, cursor, limit)
 
 
+# /{post_id} 보다 먼저 등록해야 "trending" 이 post_id 로 잡히지 않음
+@router.get("/trending")
+def trending_posts(cursor: int = 0, limit: int = 10, db: Session = Depends(get_db)):
+    return post_controller.trending_posts_controller(db, cursor, limit)
+
+
+# 분석/백업용 덤프 (조회수 안 올라감, 검수 통과한 댓글만). since_id / since_comment_id 로 증분 export
+@router.get("/export")
+def export_posts(since_id: int = 0, since_comment_id: int = 0):
+    return post_controller.export_posts_controller(since_id, since_comment_id)
+
+
 @router.get("/{post_id}")
-def get_post_detail(post_id: int, db: Session = Depends(get_db)):
-    return post_controller.get_post_detail_controller(db, post_id)
+def get_post_detail(post_id: int, viewer_id: Optional[int] = None, db: Session = Depends(get_db)):
+    # viewer_id: 로그인한 사용자 id (본인이 쓴 검수 대기 댓글을 보여주기 위해)
+    return post_controller.get_post_detail_controller(db, post_id, viewer_id)
+
+
+@router.get("/{post_id}/events")
+def post_events(post_id: int, viewer_id: Optional[int] = None, db: Session = Depends(get_db)):
+    # 새 댓글 실시간 수신 (Server-Sent Events). 폴링 대신 사용
+    return post_controller.post_events_controller(db, post_id, viewer_id)
+
 
+def _save_upload(image: UploadFile) -> str:
+    # 확장자 추출 (png, jpg 등)
+    ext = image.filename.rsplit(".", 1)[-1].lower()
+    # 중복 방지 UUID 파일명
+    filename = f"{uuid.uuid4().hex}.{ext}"
+    file_path = UPLOAD_DIR / filename
 
+    # 실제 파일 저장
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(image.file, buffer)
+
+    # 브라우저에서 접근 가능한 URL
+    return f"/static/uploads/{filename}"
+
+
+# AI 검사가 동기 호출이라 async 가 아닌 def 로 둬서 스레드풀에서 실행되게 함
 @router.post("")
-async def create_post(
+def create_post(
     title: str = Form(...),
     body: str = Form(...),
     user_id: int = Form(...),
     image: Optional[UploadFile] = File(None),  # ✅ 파일은 UploadFile 로 받기
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     db: Session = Depends(get_db),
 ):
-    image_url: Optional[str] = None
-
-    if image is not None:
-        # 확장자 추출 (png, jpg 등)
-        ext = image.filename.rsplit(".", 1)[-1].lower()
-        # 중복 방지 UUID 파일명
-        filename = f"{uuid.uuid4().hex}.{ext}"
-        file_path = UPLOAD_DIR / filename
-
-        # 실제 파일 저장
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-
-        # 브라우저에서 접근 가능한 URL
-        image_url = f"/static/uploads/{filename}"
-
-    payload: Dict[str, Any] = {
-        "title": title,
-        "body": body,
-        "author_id": user_id,
-        "image_url": image_url,  # ✅ DB에 저장할 이미지 URL
-    }
-
-    return post_controller.create_post_controller(db, payload)
+    def run():
+        payload: Dict[str, Any] = {
+            "title": title,
+            "body": body,
+            "author_id": user_id,
+            "image_url": None,
+        }
+        # 파일은 컨트롤러가 모든 검사를 통과시킨 뒤에만 저장 (거절된 요청은 파일을 안 남김)
+        save_image = (lambda: _save_upload(image)) if image is not None else None
+        return post_controller.create_post_controller(db, payload, save_image)
+
+    if idempotency_key is None:
+        return run()
+
+    # 재시도 요청이면 파일 저장 / AI 검사 / insert 없이 처음 응답을 그대로 돌려줌
+    image_info = (image.filename, image.size) if image is not None else None
+    fp = idempotency.fingerprint(title, body, user_id, image_info)
+    return idempotency_store.execute(db, f"create_post:{user_id}", idempotency_key, fp, run)
+
 
 @router.post("/{post_id}/comments")
 def create_comment(
@@ -101,6 +101,15 @@ def make_list_item(post, comments_count: int) -> PostListItem:
     )
 
 
+def make_comment_out(comment, author_nickname: str) -> CommentOut:
+    return CommentOut(
+        id=comment.id,
+        author=author_nickname or "unknown",
+        content=comment.content,
+        created_at=_format_dt(getattr(comment, "created_at", None)),
+    )
+
+
 def make_detail(post, comments: List[CommentOut]) -> PostDetail:
     comments_count = len(comments)
 